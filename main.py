@@ -1,109 +1,394 @@
 import sys
 import os
-import platform
 from datetime import datetime, timezone, timedelta
 import re
+import struct
 import json
+import importlib
 from urllib.parse import quote
 import math # Added for entropy calculation
-from collections import Counter # Added for entropy calculation
+import functools
+import threading
+import mmap
+from collections import Counter, OrderedDict # Added for entropy calculation
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QFileDialog, QLabel, QTextEdit, QTreeWidget,
     QTreeWidgetItem, QHeaderView, QStatusBar, QProgressBar,
-    QLineEdit, QStyledItemDelegate, QTreeWidgetItemIterator,
+    QLineEdit, QStyledItemDelegate,
     QDialog, QDialogButtonBox, QMenu, QStyle, QStyleFactory, QCheckBox,
     QGroupBox, QListWidget, QListWidgetItem, QDockWidget,
     QStackedWidget, QFrame, QSizePolicy
 )
 from PyQt6.QtGui import QIcon
 
-from PyQt6.QtCore import Qt, QSize, QTimer, QRect, QUrl
+from PyQt6.QtCore import (
+    Qt, QSize, QTimer, QRect, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal
+)
 from PyQt6.QtGui import (
-    QColor, QPainter, QAction, QPalette, QIcon, QPixmap, QMovie,
-    QDesktopServices, QCursor
+    QBrush, QColor, QPainter, QAction, QPalette, QIcon, QPixmap, QImage, QMovie,
+    QDesktopServices, QCursor, QFontMetrics
+)
+
+
+# The heavy parsers are only imported the first time a file actually needs them,
+# so opening the app (or analyzing a folder of one type) doesn't pay for the rest.
+_OPTIONAL_IMPORT_WARNINGS = {
+    "PIL.Image": "Pillow library not found. Image processing will fail.",
+    "PyPDF2": "PyPDF2 library not found. PDF processing will fail.",
+    "docx": "python-docx library not found. DOCX processing will fail.",
+    "mutagen": "mutagen library not found. Audio/Video processing will fail.",
+    "magic": "python-magic library not found. File type verification will be limited.",
+    "stegano.lsb": "stegano library not found. Steganography detection (LSB) will be unavailable.",
+    # Pure accelerators: the fallback path works the same, so they load silently.
+    "numpy": None,
+    "numba": None,
+    "orjson": None,
+}
+_optional_modules = {}
+_optional_import_lock = threading.Lock()
+
+
+def _optional_import(module_name):
+    """Imports an optional dependency on first use; returns None (after any warning) if it is missing."""
+    try:
+        return _optional_modules[module_name]
+    except KeyError:
+        pass
+    with _optional_import_lock:
+        if module_name not in _optional_modules:
+            try:
+                _optional_modules[module_name] = importlib.import_module(module_name)
+            except ImportError:
+                warning = _OPTIONAL_IMPORT_WARNINGS[module_name]
+                if warning:
+                    print(f"Warning: {warning}")
+                _optional_modules[module_name] = None
+        return _optional_modules[module_name]
+
+
+
+_PDF_DATE_RE = re.compile(r"D:(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})([Zz]|([+\-])(\d{2})'(\d{2})')?")
+_PDF_DATE_MATCH = _PDF_DATE_RE.match
+
+_SIZE_UNITS = ("B", "KiB", "MiB", "GiB")
+
+_GPS_DISPLAY_KEYS = frozenset({
+    'GPSLatitudeDec', 'GPSLongitudeDec', 'GPSAltitude', 'GPSPosition',
+    'GPSTimestamp', 'GPSDateStamp', 'GPSProcessingMethod', 'GPSParsingError',
+})
+
+# Encodings tried in order for EXIF byte values, and the characters that mean a decode produced nothing useful.
+_EXIF_ENCODINGS = ('utf-8', 'ascii', 'latin-1', 'windows-1252', 'utf-16le', 'utf-16be', 'shift_jis', 'cp437')
+_BAD_CHARS = frozenset(('\x00', '\ufffd'))
+# Deletes NUL padding in one pass; EXIF writers pad and sometimes embed NULs.
+_NUL_STRIP_TABLE = str.maketrans('', '', '\x00')
+
+# Top-level group labels shared by every file's subtree; sets make the per-row checks a hash lookup.
+_AUTO_EXPANDED_GROUPS = frozenset({
+    "File System Info", "EXIF Metadata", "PDF Metadata", "DOCX Metadata",
+    "Media Metadata", "GPS Info", "Steganography Analysis",
+})
+_GENERIC_GROUPS = frozenset({"File System Info", "Status", "Processing Error", "Steganography Analysis"})
+
+# "lat, lon (Altitude: ...)" values shown under GPS Info, parsed for the map context menu.
+_ALT_STRIP_RE = re.compile(r'\s*\(Altitude:.*\)')
+_LATLON_RE = re.compile(r'^([-+]?\d{1,3}(?:\.\d+)?)\s*,\s*([-+]?\d{1,3}(?:\.\d+)?)$')
+_EDITOR_SOFTWARE_RE = re.compile(r'photoshop|editor', re.IGNORECASE)
+_SUSPICIOUS_PRODUCER_RE = re.compile(r'crack|keygen|patch|converter', re.IGNORECASE)
+
+# Extension -> ((libmagic keyword, warning), ...) so each file only checks the rules for its own extension.
+_SIGNATURE_RULES = {
+    ".jpg": (
+        ("PDF", "⚠️ FAKE IMAGE: This is actually a PDF document!"),
+        ("executable", "🚨 MALWARE: This 'image' is an executable!"),
+    ),
+    ".pdf": (("executable", "🚨 MALWARE: This PDF is an executable!"),),
+    ".docx": (("executable", "🚨 MALWARE: This document is an executable!"),),
+    ".exe": (("text", "⚠️ SUSPICIOUS: Executable masquerading as text"),),
+    ".zip": (("executable", "🚨 MALWARE: Archive is actually an executable!"),),
+    ".png": (("executable", "🚨 MALWARE: This image is an executable!"),),
+}
+
+_EXECUTABLE_EXTENSIONS = frozenset({'.exe', '.dll', '.bat', '.ps1', '.sh'})
+
+# Lowercased extensions as returned by os.path.splitext, so type checks are one set lookup.
+_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff"})
+_LSB_EXTENSIONS = frozenset({".png", ".bmp"})
+_EXIF_EXPECTED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png"})
+_MEDIA_EXTENSIONS = frozenset({".mp3", ".mp4"})
+_SMALL_FILE_EXTENSIONS = frozenset({".jpg", ".png", ".pdf", ".docx"})
+_SUPPORTED_EXTENSIONS = _IMAGE_EXTENSIONS | _MEDIA_EXTENSIONS | {".pdf", ".docx"}
+_SIGNATURE_HEADER_SIZE = 4096
+_MEDIA_CACHE_SIZE = 4096
+_MISSING = object()
+_MIME_CACHE = {}
+# Failures expected from reading and parsing a media container besides MutagenError;
+# anything else is a bug and is left to analyze_file's catch-all.
+_MEDIA_EXC = (OSError, ValueError, EOFError, struct.error)
+
+# (easy tag key, display name) and (stream info attribute, display name), in display order.
+_COMMON_MEDIA_TAGS = (
+    ('title', 'Title'),
+    ('artist', 'Artist'),
+    ('album', 'Album'),
+    ('date', 'Date'),
+    ('genre', 'Genre'),
+    ('tracknumber', 'Track Number'),
+    ('comment', 'Comment'),
+    ('albumartist', 'Album Artist'),
+    ('composer', 'Composer'),
+    ('discnumber', 'Disc Number'),
+    ('organization', 'Organization'),
+    ('encodedby', 'Encoded By'),
+    ('copyright', 'Copyright'),
 )
+_MEDIA_TECH_ATTRS = (
+    ('length', 'Duration (s)'),
+    ('bitrate', 'Bitrate (bps)'),
+    ('sample_rate', 'Sample Rate (Hz)'),
+    ('channels', 'Channels'),
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _derive_fs_times(st_mtime, st_ctime, st_birthtime):
+    """Returns naive local (creation, modification) datetimes for a set of stat timestamps."""
+    ts_cre = st_birthtime if st_birthtime else st_ctime
+    return datetime.fromtimestamp(ts_cre), datetime.fromtimestamp(st_mtime)
 
 
-try:
-    from PIL import Image, UnidentifiedImageError
-    from PIL.ExifTags import TAGS, GPSTAGS
-except ImportError:
-    print("Warning: Pillow library not found. Image processing will fail.")
-    Image = None
-    UnidentifiedImageError = None
-    TAGS = {}
-    GPSTAGS = {}
-
-try:
-    import PyPDF2
-except ImportError:
-    print("Warning: PyPDF2 library not found. PDF processing will fail.")
-    PyPDF2 = None
-
-try:
-    from docx import Document
-except ImportError:
-    print("Warning: python-docx library not found. DOCX processing will fail.")
-    Document = None
-
-try:
-    import mutagen
-except ImportError:
-    print("Warning: mutagen library not found. Audio/Video processing will fail.")
-    mutagen = None
-
-try:
-    import magic
-except ImportError:
-    print("Warning: python-magic library not found. File type verification will be limited.")
-    magic = None
-
-try:
-    from stegano import lsb # Added for stegano detection
-except ImportError:
-    print("Warning: stegano library not found. Steganography detection (LSB) will be unavailable.")
-    lsb = None
+def _fs_times(stats):
+    """Filesystem creation/modification times used by the metadata-vs-filesystem date checks."""
+    return _derive_fs_times(stats.st_mtime, stats.st_ctime, getattr(stats, 'st_birthtime', None))
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_exif_datetime_str(dt_str):
+    """Parses a stripped EXIF 'YYYY:MM:DD HH:MM:SS' stamp; burst shots repeat the same values."""
+    # The canonical form has fixed offsets, so slice it instead of running strptime.
+    if (len(dt_str) == 19 and dt_str[4] == ':' and dt_str[7] == ':' and dt_str[10] == ' '
+            and dt_str[13] == ':' and dt_str[16] == ':'
+            and dt_str[0:4].isdigit() and dt_str[5:7].isdigit() and dt_str[8:10].isdigit()
+            and dt_str[11:13].isdigit() and dt_str[14:16].isdigit() and dt_str[17:19].isdigit()):
+        try:
+            return datetime(int(dt_str[0:4]), int(dt_str[5:7]), int(dt_str[8:10]),
+                            int(dt_str[11:13]), int(dt_str[14:16]), int(dt_str[17:19]))
+        except ValueError:
+            pass
+
+    try:
+        return datetime.strptime(dt_str, '%Y:%m:%d %H:%M:%S')
+    except ValueError:
+        print(f"Warning: Could not parse EXIF datetime string: '{dt_str}'")
+        return None
 
 
 def parse_pdf_date(date_str):
     """Parses PDF date strings into datetime objects."""
     if not isinstance(date_str, str):
         return None
+    # PyPDF2 hands back str subclasses; normalise so equal dates share one cache entry.
+    return _parse_pdf_date_str(str(date_str))
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_pdf_date_str(date_str):
+    """Memoized body of parse_pdf_date; the same producer stamps repeat across a folder."""
+    # The D:YYYYMMDDHHmmSS prefix sits at fixed offsets, so slice it directly
+    # and only hand strings that don't follow the canonical shape to the regex.
+    if len(date_str) >= 16 and date_str.startswith("D:") and date_str[2:16].isdigit():
+        components = (date_str[2:6], date_str[6:8], date_str[8:10],
+                      date_str[10:12], date_str[12:14], date_str[14:16])
+        tz_part = date_str[16:17]
+        offset_sign = offset_h = offset_m = None
+        if (tz_part in ('+', '-') and date_str[19:20] == "'" and date_str[22:23] == "'"
+                and date_str[17:19].isdigit() and date_str[20:22].isdigit()):
+            offset_sign, offset_h, offset_m = tz_part, date_str[17:19], date_str[20:22]
+    else:
+        match = _PDF_DATE_MATCH(date_str)
+        if not match:
+            return None
+        components = match.groups()[:6]
+        tz_part = match.group(7)
+        offset_sign = match.group(8)
+        offset_h = match.group(9)
+        offset_m = match.group(10)
 
-    match = re.match(r"D:(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})(\d{2})([Zz]|([+\-])(\d{2})'(\d{2})')?", date_str)
-    if match:
-        try:
-            year, month, day, hour, minute, second = map(int, match.groups()[:6])
-            tz_part = match.group(7)
-            offset_sign = match.group(9)
-            offset_h = match.group(10)
-            offset_m = match.group(11)
-
-            if not (1 <= month <= 12 and 1 <= day <= 31 and 0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59):
-                print(f"Warning: Invalid date/time components in PDF date '{date_str}'")
-                return None
-
-            dt = datetime(year, month, day, hour, minute, second)
-
-            if tz_part and tz_part.lower() == 'z':
-                dt = dt.replace(tzinfo=timezone.utc)
-            elif offset_sign and offset_h and offset_m:
-                offset_h = int(offset_h)
-                offset_m = int(offset_m)
-                delta = timedelta(hours=offset_h, minutes=offset_m)
-                if offset_sign == '-':
-                    delta = -delta
-                tz = timezone(delta)
-                dt = dt.replace(tzinfo=tz)
-
-            return dt
-        except (ValueError, TypeError) as e:
-            print(f"Warning: Error parsing PDF date string '{date_str}': {e}")
+    try:
+        year, month, day, hour, minute, second = map(int, components)
+
+        if not (1 <= month <= 12 and 1 <= day <= 31 and 0 <= hour <= 23 and 0 <= minute <= 59 and 0 <= second <= 59):
+            print(f"Warning: Invalid date/time components in PDF date '{date_str}'")
             return None
-    return None
+
+        dt = datetime(year, month, day, hour, minute, second)
+
+        if tz_part and tz_part.lower() == 'z':
+            dt = dt.replace(tzinfo=timezone.utc)
+        elif offset_sign and offset_h and offset_m:
+            offset_h = int(offset_h)
+            offset_m = int(offset_m)
+            delta = timedelta(hours=offset_h, minutes=offset_m)
+            if offset_sign == '-':
+                delta = -delta
+            tz = timezone(delta)
+            dt = dt.replace(tzinfo=tz)
+
+        return dt
+    except (ValueError, TypeError) as e:
+        print(f"Warning: Error parsing PDF date string '{date_str}': {e}")
+        return None
+
+
+_PDF_INFO_FIELDS = {
+    '/Title': "Title",
+    '/Author': "Author",
+    '/Subject': "Subject",
+    '/Producer': "Producer",
+    '/Creator': "Creator",
+    '/CreationDate': "Creation Date",
+    '/ModDate': "Modification Date",
+    '/Keywords': "Keywords"
+}
+
+
+def _pdf_page_count(reader):
+    """Reads the page count from the /Root/Pages/Count entry rather than flattening the page tree."""
+    try:
+        count = reader.trailer["/Root"]["/Pages"]["/Count"]
+        if isinstance(count, int) and count >= 0:
+            return int(count)
+    except Exception:
+        pass
+    # Missing or malformed catalogue: let PyPDF2 walk the tree as before.
+    return len(reader.pages)
+
+
+def _dump_json(obj):
+    """Serializes obj to indented JSON bytes, using orjson's native encoder when it is installed."""
+    orjson = _optional_import("orjson")
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    # Match orjson's output (2-space indent, raw UTF-8) so exports don't depend on what is installed.
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+_ENTROPY_CHUNK_SIZE = 1 << 20
+_ENTROPY_CACHE_SIZE = 500
+
+
+def _iter_chunks(file_path, size=_ENTROPY_CHUNK_SIZE):
+    """Yields a file's contents in fixed-size blocks so it is never held in memory whole."""
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(size), b''):
+            yield chunk
+
+
+def _byte_histogram(chunks):
+    """Counts byte values across an iterable of blocks without numpy, returning (256 counts, total bytes)."""
+    total_bytes = 0
+    byte_counts = Counter()
+    for chunk in chunks:
+        byte_counts.update(chunk)
+        total_bytes += len(chunk)
+    return [byte_counts[i] for i in range(256)], total_bytes
+
+
+def _count_bytes_into(data, counts):
+    """Adds the byte values of a uint8 array into a 256-bin counts array (numba kernel body)."""
+    for i in range(data.size):
+        counts[data[i]] += 1
+
+
+_numba_kernel = None
+_numba_kernel_resolved = False
+_numba_kernel_lock = threading.Lock()
+
+
+def _numba_byte_counts():
+    """Returns the jitted byte counter, compiling it on the first full-file scan; None without numba."""
+    global _numba_kernel, _numba_kernel_resolved
+    if _numba_kernel_resolved:
+        return _numba_kernel
+    # Analysis workers race here on the first scan; only one may import numba and
+    # compile (or load the cached) kernel.
+    with _numba_kernel_lock:
+        if not _numba_kernel_resolved:
+            numba = _optional_import("numba")
+            if numba is not None:
+                np = _optional_import("numpy")
+                # Counting straight off the uint8 view avoids bincount's widening copy, and
+                # nogil lets the analysis workers histogram different files concurrently.
+                kernel = numba.njit(cache=True, nogil=True, boundscheck=False)(_count_bytes_into)
+                # njit compiles on first call; do it here, for the read-only contiguous
+                # uint8 views that np.frombuffer returns over a read-only map.
+                sample = np.zeros(1, dtype=np.uint8)
+                sample.flags.writeable = False
+                kernel(sample, np.zeros(256, dtype=np.int64))
+                _numba_kernel = kernel
+            _numba_kernel_resolved = True
+    return _numba_kernel
+
+
+def _mmap_byte_histogram(file_path):
+    """Counts byte values through a read-only memory map, so the file is never copied into Python bytes."""
+    np = _optional_import("numpy")
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return np.zeros(256, dtype=np.int64), 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                counts = np.zeros(256, dtype=np.int64)
+                count_bytes = _numba_byte_counts()
+                if count_bytes is not None:
+                    count_bytes(data, counts)
+                else:
+                    # bincount widens its input to intp, so feed it bounded slices of the map.
+                    for start in range(0, size, _ENTROPY_CHUNK_SIZE):
+                        counts += np.bincount(data[start:start + _ENTROPY_CHUNK_SIZE], minlength=256)
+            finally:
+                # The map can't close while numpy still holds a view of it; drop the view
+                # on every path so a failure surfaces as itself, not as a BufferError.
+                del data
+    return counts, size
+
+
+def _histogram_entropy(counts, total_bytes):
+    """Returns the Shannon entropy, in bits per byte, of a byte histogram."""
+    if not total_bytes:
+        return 0.0
+
+    # -sum(p * log2(p)) with p = n / N rewritten as log2(N) - sum(n * log2(n)) / N,
+    # so the per-bin work is on the integer counts and there is no division per bin.
+    # The subtraction can land a hair below zero for single-valued data, hence the clamp.
+    np = _optional_import("numpy")
+    if np is not None:
+        nonzero = counts[counts > 0].astype(np.float64)
+        weighted_log_sum = float((nonzero * np.log2(nonzero)).sum())
+    else:
+        weighted_log_sum = sum(count * math.log2(count) for count in counts if count)
+
+    return max(0.0, math.log2(total_bytes) - weighted_log_sum / total_bytes)
+
+
+# Icons are rendered on first request (after QApplication exists) and reused afterwards.
+_EMOJI_ICON_CACHE = {}
+_ICON_CACHE = {}
+
+
 def emoji_to_icon(emoji, size=32):
+    """Rasterizes an emoji into a QIcon, reusing earlier renders of the same emoji and size."""
+    key = (emoji, size)
+    icon = _EMOJI_ICON_CACHE.get(key)
+    if icon is None:
+        icon = _EMOJI_ICON_CACHE[key] = _render_emoji_icon(emoji, size)
+    return icon
+
+def _render_emoji_icon(emoji, size):
     label = QLabel()
     label.setText(emoji)
     label.setStyleSheet(f"font-size: {size}px;")
@@ -118,7 +403,13 @@ def emoji_to_icon(emoji, size=32):
 
 def get_icon(icon_name):
     """Get system icon or fallback to theme icon."""
-    if platform.system() == 'Windows':
+    icon = _ICON_CACHE.get(icon_name)
+    if icon is None:
+        icon = _ICON_CACHE[icon_name] = _create_icon(icon_name)
+    return icon
+
+def _create_icon(icon_name):
+    if sys.platform == 'win32':
         icons = {
             'file': '📄',
             'image': '🖼️',
@@ -164,53 +455,68 @@ class HighlightDelegate(QStyledItemDelegate):
         self.highlight_color = QColor(255, 255, 0, 120)
         self.search_text = ""
         self.case_sensitive = False
+        self._search_regex = None
+        # QFont hashes by identity, so metrics are keyed on font.key(); a font change
+        # simply produces a new key.
+        self._fm_cache = {}
 
     def set_search_text(self, text):
         self.search_text = text.strip()
+        self._compile_search_regex()
         if self.parent() and hasattr(self.parent(), 'viewport'):
             self.parent().viewport().update()
 
     def set_case_sensitive(self, sensitive):
         if self.case_sensitive != sensitive:
             self.case_sensitive = sensitive
+            self._compile_search_regex()
             if self.parent() and hasattr(self.parent(), 'viewport'):
                 self.parent().viewport().update()
 
+    def _compile_search_regex(self):
+        """Compiles the search text once so paint() can locate matches without re-lowercasing each cell."""
+        if self.search_text:
+            flags = 0 if self.case_sensitive else re.IGNORECASE
+            self._search_regex = re.compile(re.escape(self.search_text), flags)
+        else:
+            self._search_regex = None
+
     def paint(self, painter, option, index):
         super().paint(painter, option, index)
 
-        if not self.search_text or index.column() < 0:
+        if self._search_regex is None or index.column() < 0:
             return
 
         text = index.data(Qt.ItemDataRole.DisplayRole)
         if not text or not isinstance(text, str):
             return
 
-        is_selected = option.state & QStyle.StateFlag.State_Selected
-        compare_text = text if self.case_sensitive else text.lower()
-        compare_search = self.search_text if self.case_sensitive else self.search_text.lower()
-
-        if compare_search in compare_text and not is_selected:
-            fm = option.fontMetrics
-            text_rect = option.rect.adjusted(2, 1, -2, -1)
-
-            start_pos = compare_text.find(compare_search)
-            while start_pos != -1:
-                before_text = text[:start_pos]
-                matched_text = text[start_pos : start_pos + len(compare_search)]
-
-                x_start = fm.horizontalAdvance(before_text)
-                match_width = fm.horizontalAdvance(matched_text)
-
-                highlight_rect = QRect(text_rect.x() + x_start, text_rect.y(), match_width, text_rect.height())
+        if option.state & QStyle.StateFlag.State_Selected:
+            return
 
+        fm = None
+        text_rect = None
+        for match in self._search_regex.finditer(text):
+            if text_rect is None:
+                font_key = option.font.key()
+                fm = self._fm_cache.get(font_key)
+                if fm is None:
+                    fm = self._fm_cache[font_key] = QFontMetrics(option.font)
+                text_rect = option.rect.adjusted(2, 1, -2, -1)
                 painter.save()
                 painter.setPen(Qt.PenStyle.NoPen)
                 painter.setBrush(self.highlight_color)
-                painter.drawRect(highlight_rect)
-                painter.restore()
 
-                start_pos = compare_text.find(compare_search, start_pos + 1)
+            # Measure slices: horizontalAdvance's length argument counts UTF-16 units, which
+            # drift from re's code-point offsets after any non-BMP character such as emoji.
+            start, end = match.span()
+            x_start = fm.horizontalAdvance(text[:start])
+            match_width = fm.horizontalAdvance(text[start:end])
+
+            painter.drawRect(QRect(text_rect.x() + x_start, text_rect.y(), match_width, text_rect.height()))
+
+        if text_rect is not None:
+            painter.restore()
 
 
 class MetadataTreeWidget(QTreeWidget):
@@ -249,8 +555,8 @@ class MetadataTreeWidget(QTreeWidget):
 
             if coordinate_value_text:
 
-                potential_gps_text = re.sub(r'\s*\(Altitude:.*\)', '', coordinate_value_text).strip()
-                match = re.match(r'^([-+]?\d{1,3}(?:\.\d+)?)\s*,\s*([-+]?\d{1,3}(?:\.\d+)?)$', potential_gps_text)
+                potential_gps_text = _ALT_STRIP_RE.sub('', coordinate_value_text).strip()
+                match = _LATLON_RE.match(potential_gps_text)
                 if match:
                     try:
                         lat_val = float(match.group(1))
@@ -310,11 +616,8 @@ class MetadataTreeWidget(QTreeWidget):
     def show_file_preview(self, item):
         """Shows preview for the selected file"""
 
-        parent = self.parent()
-        while parent is not None and not isinstance(parent, MetadataAnalyzerApp):
-            parent = parent.parent()
-
-        if parent and hasattr(parent, 'update_preview'):
+        parent = self.window()
+        if hasattr(parent, 'update_preview'):
 
             filename = item.text(0)
             file_path = self.file_path_map.get(filename)
@@ -328,17 +631,20 @@ class MetadataTreeWidget(QTreeWidget):
         QApplication.clipboard().setText("\n".join(texts))
 
     def _collect_child_metadata(self, item, texts_list, indent):
-        """Recursive helper to collect metadata text."""
-        for i in range(item.childCount()):
-            child = item.child(i)
+        """Collects metadata text in tree order using an explicit stack."""
+        stack = [(item.child(i), indent) for i in range(item.childCount() - 1, -1, -1)]
+        while stack:
+            child, child_indent = stack.pop()
             prop = child.text(0)
-            val = child.text(1) if child.text(1) else ""
-            if val or child.childCount() == 0:
-                texts_list.append(f"{indent}{prop}: {val}")
+            val = child.text(1)
+            child_count = child.childCount()
+            if val or child_count == 0:
+                texts_list.append(f"{child_indent}{prop}: {val}")
             else:
-                texts_list.append(f"{indent}{prop}:")
-            if child.childCount() > 0:
-                self._collect_child_metadata(child, texts_list, indent + "  ")
+                texts_list.append(f"{child_indent}{prop}:")
+            grandchild_indent = child_indent + "  "
+            for i in range(child_count - 1, -1, -1):
+                stack.append((child.child(i), grandchild_indent))
 
     def copy_cell_text(self, item, column):
         """Copies the text of a specific cell to the clipboard."""
@@ -350,9 +656,6 @@ class MetadataTreeWidget(QTreeWidget):
 
     def export_metadata(self, item):
         """Exports metadata as JSON to a file."""
-        metadata = {}
-        self._collect_metadata_dict(item, metadata)
-
         file_path, _ = QFileDialog.getSaveFileName(
             self, "Export Metadata",
             f"{item.text(0)}_metadata.json",
@@ -361,8 +664,11 @@ class MetadataTreeWidget(QTreeWidget):
 
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(metadata, f, indent=4)
+                metadata = {}
+                self._collect_metadata_dict(item, metadata)
+                payload = _dump_json(metadata)
+                with open(file_path, 'wb') as f:
+                    f.write(payload)
 
                 parent_app = self.window()
                 if hasattr(parent_app, 'status_bar'):
@@ -374,19 +680,22 @@ class MetadataTreeWidget(QTreeWidget):
 
 
     def _collect_metadata_dict(self, item, metadata_dict):
-        """Recursive helper to collect metadata as dictionary."""
-        for i in range(item.childCount()):
-            child = item.child(i)
+        """Collects metadata as a nested dictionary using an explicit stack."""
+        stack = [(item.child(i), metadata_dict) for i in range(item.childCount() - 1, -1, -1)]
+        while stack:
+            child, target_dict = stack.pop()
             prop = child.text(0)
-            val = child.text(1) if child.text(1) else None
+            val = child.text(1) or None
+            child_count = child.childCount()
 
-            if child.childCount() > 0:
+            if child_count > 0:
                 child_dict = {}
-                self._collect_metadata_dict(child, child_dict)
-                metadata_dict[prop] = child_dict
+                target_dict[prop] = child_dict
+                for i in range(child_count - 1, -1, -1):
+                    stack.append((child.child(i), child_dict))
             else:
                 if val is not None:
-                    metadata_dict[prop] = val
+                    target_dict[prop] = val
 
 class PreviewWidget(QWidget):
     def __init__(self, parent=None):
@@ -412,7 +721,7 @@ class PreviewWidget(QWidget):
     def set_image_preview(self, file_path):
         """Sets an image preview."""
         try:
-            pixmap = QPixmap(file_path)
+            pixmap = self._load_preview_pixmap(file_path, 400)
             if not pixmap.isNull():
 
                 scaled_pixmap = pixmap.scaled(
@@ -428,6 +737,25 @@ class PreviewWidget(QWidget):
             print(f"Error loading image preview: {e}")
             self.preview_label.setText("Error loading preview")
 
+    def _load_preview_pixmap(self, file_path, size):
+        """Decodes an image at roughly preview size instead of its native resolution."""
+        Image = _optional_import("PIL.Image")
+        if not Image:
+            return QPixmap(file_path)
+
+        try:
+            with Image.open(file_path) as image:
+                # For JPEGs, draft() makes libjpeg decode at a reduced DCT scale.
+                image.draft('RGB', (size, size))
+                image.thumbnail((size, size), Image.Resampling.BILINEAR)
+                image = image.convert('RGBA')
+                data = image.tobytes('raw', 'RGBA')
+                qimage = QImage(data, image.width, image.height, image.width * 4, QImage.Format.Format_RGBA8888)
+                return QPixmap.fromImage(qimage)
+        except (Image.UnidentifiedImageError, OSError):
+            # Let Qt's own decoders have a go at anything PIL can't read.
+            return QPixmap(file_path)
+
     def set_pdf_preview(self, file_path):
         """Sets a PDF preview (first page as image)."""
         self.preview_label.setText("PDF preview requires additional libraries")
@@ -473,7 +801,7 @@ class AnomaliesDialog(QDialog):
 
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
-        self.text_edit.setText("\n".join(anomalies_list) if anomalies_list else "No anomalies detected.")
+        self.text_edit.setPlainText("\n".join(anomalies_list) if anomalies_list else "No anomalies detected.")
         self.layout.addWidget(self.text_edit)
 
         self.button_box = QDialogButtonBox()
@@ -504,7 +832,7 @@ class LogicalIssuesDialog(QDialog):
 
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
-        self.text_edit.setText("\n\n".join(issues_list) if issues_list else "No logical issues detected.")
+        self.text_edit.setPlainText("\n\n".join(issues_list) if issues_list else "No logical issues detected.")
         self.layout.addWidget(self.text_edit)
 
         self.button_box = QDialogButtonBox()
@@ -522,8 +850,52 @@ class LogicalIssuesDialog(QDialog):
         QTimer.singleShot(1500, lambda: self.copy_button.setText("Copy All to Clipboard"))
 
 
+class AnalysisSignals(QObject):
+    """Carries finished analysis results from worker threads back to the GUI thread."""
+    file_done = pyqtSignal(int, object)
+
+
+class FileAnalyzeTask(QRunnable):
+    """Analyzes a single file on a QThreadPool worker and reports the detached tree item and its issues."""
+
+    def __init__(self, app, index, file_path, check_stegano):
+        super().__init__()
+        self.app = app
+        self.index = index
+        self.file_path = file_path
+        self.check_stegano = check_stegano
+
+    def run(self):
+        cancelled = self.app._analysis_cancelled
+        if cancelled.is_set():
+            return
+        try:
+            result = self.app.analyze_file(self.file_path, self.check_stegano)
+        except Exception as e:
+            base_name = os.path.basename(self.file_path)
+            file_item = QTreeWidgetItem([base_name])
+            error_item = QTreeWidgetItem(file_item, ["Processing Error", str(e)])
+            error_item.setForeground(1, self.app._C_RED)
+            result = (file_item, [f"{base_name}: Unexpected error during processing - {e}"], [])
+        if not cancelled.is_set():
+            self.app.analysis_signals.file_done.emit(self.index, result)
+
+
 class MetadataAnalyzerApp(QMainWindow):
 
+    # Shared foreground brushes for tree rows. setForeground() takes a QBrush, so passing
+    # a QColor would build a temporary brush on every call.
+    _C_ORANGE = QBrush(QColor("orange"))
+    _C_RED = QBrush(QColor("red"))
+    _C_GRAY = QBrush(QColor("gray"))
+    _C_PURPLE = QBrush(QColor(139, 0, 139))
+    _C_BLUE = QBrush(QColor("blue"))
+    _C_GREEN = QBrush(QColor(0, 100, 0))
+
+    # strftime formats for File System Info: zone-aware, and naive when the epoch conversion fails.
+    _DT_FORMAT = "%Y-%m-%d %H:%M:%S %Z%z"
+    _DT_FORMAT_NAIVE = "%Y-%m-%d %H:%M:%S (Local?)"
+
     COLOR_PALETTE = {
         "darkest": "#0D1321",
         "darker": "#1D2D44",
@@ -540,10 +912,58 @@ class MetadataAnalyzerApp(QMainWindow):
         self.logical_issues = []
         self.current_file_index = 0
         self.current_file_path = None
-        self.processing_timer = QTimer(self)
-        self.processing_timer.setInterval(10)
-        self.processing_timer.timeout.connect(self.process_next_file)
 
+        # Files are analyzed on a dedicated thread pool, one worker per core; finished
+        # items are parked here and attached to the tree in file order by the flush timer.
+        self._analysis_pool = QThreadPool(self)
+        self._analysis_pool.setMaxThreadCount(os.cpu_count() or 1)
+        self.analysis_signals = AnalysisSignals(self)
+        self.analysis_signals.file_done.connect(self._on_file_analyzed)
+        # Set when the window closes so queued and running workers stop touching the app.
+        self._analysis_cancelled = threading.Event()
+        self._pending_results = {}
+        self._completed_count = 0
+        # Flat (top item, item, child count, text, casefolded text) rows for the search
+        # filter, filled as items are attached so keystrokes never walk the tree.
+        self._search_index = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_analyzed_files)
+
+        # Coalesces search keystrokes so the tree is only filtered once typing pauses.
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(150)
+        self._search_debounce.timeout.connect(self._do_filter_metadata)
+
+        # One libmagic handle for the whole session, opened on first use so the magic
+        # database is loaded once. libmagic cookies are not thread-safe, so workers
+        # take turns with the handle.
+        self._magic = None
+        self._magic_initialized = False
+        self._magic_lock = threading.Lock()
+
+        # Extension -> (file type, required module, processor): one dict lookup per file
+        # instead of an endswith cascade.
+        self._ext_handlers = {
+            ext: (file_type, module_name, handler)
+            for exts, file_type, module_name, handler in (
+                (_IMAGE_EXTENSIONS, "image", "PIL.Image", self.process_image_exif),
+                ((".pdf",), "pdf", "PyPDF2", self.process_pdf),
+                ((".docx",), "docx", "docx", self.process_docx),
+                (_MEDIA_EXTENSIONS, "media", "mutagen", self.process_media),
+            )
+            for ext in exts
+        }
+
+        # (absolute path, size, mtime_ns) -> entropy, so re-analyzing unchanged files skips the scan.
+        self._entropy_cache = OrderedDict()
+        self._entropy_cache_lock = threading.Lock()
+
+        # (st_dev, st_ino, size, mtime_ns) -> parsed media rows, so hard links and re-scans
+        # of unchanged files share one mutagen parse.
+        self._media_cache = OrderedDict()
+        self._media_cache_lock = threading.Lock()
 
         self.init_ui()
 
@@ -552,7 +972,9 @@ class MetadataAnalyzerApp(QMainWindow):
 
             self.tree.file_path_map = {}
 
-
+        # Both stylesheets are formatted once; toggling just hands Qt the prebuilt string.
+        self._qss_light = self._build_light_qss()
+        self._qss_dark = self._build_dark_qss()
         self.apply_light_theme()
 
 
@@ -689,7 +1111,10 @@ class MetadataAnalyzerApp(QMainWindow):
         self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
         self.tree.header().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.tree.setAlternatingRowColors(True)
+        self.tree.setUniformRowHeights(True)
         self.tree.setColumnWidth(0, 300)
+        # Previews are only rendered for the file the user is looking at.
+        self.tree.currentItemChanged.connect(self._on_current_item_changed)
 
 
 
@@ -723,31 +1148,33 @@ class MetadataAnalyzerApp(QMainWindow):
 
         self.status_bar.addPermanentWidget(self.progress_bar)
 
-    def check_file_signature_mismatch(self, file_path):
+    def check_file_signature_mismatch(self, file_path, ext):
         """Detects mismatches between file extension and actual content type."""
-        if not magic:
+        with self._magic_lock:
+            if not self._magic_initialized:
+                self._magic_initialized = True
+                magic = _optional_import("magic")
+                if magic:
+                    try:
+                        self._magic = magic.Magic()
+                    except Exception as e:
+                        print(f"Warning: Could not initialize libmagic: {e}")
+        if self._magic is None:
             return None
 
         try:
-            true_type = magic.from_file(file_path)
-            ext = os.path.splitext(file_path)[1].lower()
-
-            red_flags = {
-                (".jpg", "PDF"): "⚠️ FAKE IMAGE: This is actually a PDF document!",
-                (".jpg", "executable"): "🚨 MALWARE: This 'image' is an executable!",
-                (".pdf", "executable"): "🚨 MALWARE: This PDF is an executable!",
-                (".docx", "executable"): "🚨 MALWARE: This document is an executable!",
-                (".exe", "text"): "⚠️ SUSPICIOUS: Executable masquerading as text",
-                (".zip", "executable"): "🚨 MALWARE: Archive is actually an executable!",
-                (".png", "executable"): "🚨 MALWARE: This image is an executable!"
-            }
+            # libmagic only needs the leading bytes; don't let it map the whole file.
+            with open(file_path, 'rb') as f:
+                header = f.read(_SIGNATURE_HEADER_SIZE)
+            with self._magic_lock:
+                true_type = self._magic.from_buffer(header)
 
-            for (expected_ext, type_keyword), warning in red_flags.items():
-                if ext == expected_ext and type_keyword in true_type:
+            for type_keyword, warning in _SIGNATURE_RULES.get(ext, ()):
+                if type_keyword in true_type:
                     return warning
 
 
-            if "executable" in true_type and not ext.lower() in ('.exe', '.dll', '.bat', '.ps1', '.sh'):
+            if "executable" in true_type and ext not in _EXECUTABLE_EXTENSIONS:
                 return f"⚠️ SUSPICIOUS: {ext} file is actually an executable!"
 
         except Exception as e:
@@ -782,28 +1209,28 @@ class MetadataAnalyzerApp(QMainWindow):
 
         return warnings
 
-    def check_file_size_anomalies(self, file_path, file_stats):
+    def check_file_size_anomalies(self, file_path, file_stats, ext):
         """Detects suspicious file size patterns."""
         warnings = []
-        base_name = os.path.basename(file_path)
 
 
         if file_stats.st_size == 0:
             warnings.append("🚨 EMPTY FILE: Possible malware placeholder or incomplete transfer")
 
 
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext in ('.jpg', '.png', '.pdf', '.docx') and file_stats.st_size < 512:
+        if ext in _SMALL_FILE_EXTENSIONS and file_stats.st_size < 512:
             warnings.append(f"⚠️ SUSPICIOUSLY SMALL: Only {self.format_size(file_stats.st_size)} for a {ext.upper()} file")
 
         return warnings
 
-    def check_steganography(self, file_path, file_item):
-        base_name = os.path.basename(file_path)
+    def check_steganography(self, file_path, file_item, base_name, ext, anomalies):
         stegano_root = QTreeWidgetItem(file_item, ["Steganography Analysis"])
+        # Rows are built unparented and attached with one addChildren() at the end.
+        pending = []
         has_stegano_findings = False
+        lsb = _optional_import("stegano.lsb")
 
-        if lsb and file_path.lower().endswith(('.png', '.bmp')):
+        if lsb and ext in _LSB_EXTENSIONS:
             try:
                 hidden_message = None
                 try:
@@ -813,89 +1240,105 @@ class MetadataAnalyzerApp(QMainWindow):
 
                 if hidden_message and hidden_message.strip():
                     warning = f"🔍 STEGANOGRAPHY (LSB): Possible hidden data detected."
-                    warn_item = QTreeWidgetItem(stegano_root, ["⚠️ LSB Detection", warning])
-                    warn_item.setForeground(0, QColor("orange"))
-                    self.anomalies.append(f"File '{base_name}': {warning}")
+                    warn_item = QTreeWidgetItem(["⚠️ LSB Detection", warning])
+                    warn_item.setForeground(0, self._C_ORANGE)
+                    pending.append(warn_item)
+                    anomalies.append(f"File '{base_name}': {warning}")
                     has_stegano_findings = True
                 else:
-                    QTreeWidgetItem(stegano_root, ["LSB Detection", "No easily extractable LSB data found."])
+                    pending.append(QTreeWidgetItem(["LSB Detection", "No easily extractable LSB data found."]))
 
             except PermissionError as e:
                 perm_error_msg = f"[Permission Denied] Could not check LSB: {e}"
-                QTreeWidgetItem(stegano_root, ["LSB Detection Error", perm_error_msg]).setForeground(1, QColor("gray"))
+                error_item = QTreeWidgetItem(["LSB Detection Error", perm_error_msg])
+                error_item.setForeground(1, self._C_GRAY)
+                pending.append(error_item)
                 print(f"Warning: Permission error during LSB check for {base_name}: {e}")
 
             except Exception as e:
-                QTreeWidgetItem(stegano_root, ["LSB Detection Error", f"Failed to check Lsb: {e}"]).setForeground(1, QColor("red"))
-                self.anomalies.append(f"File '{base_name}': Error checking LSB steganography - {e}")
+                error_item = QTreeWidgetItem(["LSB Detection Error", f"Failed to check Lsb: {e}"])
+                error_item.setForeground(1, self._C_RED)
+                pending.append(error_item)
+                anomalies.append(f"File '{base_name}': Error checking LSB steganography - {e}")
                 has_stegano_findings = True
 
 
-        elif lsb and not file_path.lower().endswith(('.png', '.bmp')):
-             QTreeWidgetItem(stegano_root, ["LSB Detection", "Skipped (only supports PNG and BMP)."])
+        elif lsb:
+             pending.append(QTreeWidgetItem(["LSB Detection", "Skipped (only supports PNG and BMP)."]))
 
         elif not lsb:
-            QTreeWidgetItem(stegano_root, ["LSB Detection", "Stegano library not found."]).setForeground(1, QColor("orange"))
+            error_item = QTreeWidgetItem(["LSB Detection", "Stegano library not found."])
+            error_item.setForeground(1, self._C_ORANGE)
+            pending.append(error_item)
 
 
-        if file_path.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff')):
+        if ext in _IMAGE_EXTENSIONS:
             try:
                 entropy = self.calculate_entropy(file_path)
                 entropy_threshold = 7.8
 
                 # Create the Entropy item without forcing a specific color
-                entropy_item = QTreeWidgetItem(stegano_root, ["Entropy", f"{entropy:.4f}"])
+                pending.append(QTreeWidgetItem(["Entropy", f"{entropy:.4f}"]))
                 # Removed: entropy_item.setForeground(0, entropy_color)
 
 
                 if entropy > entropy_threshold:
                     warning = f"⚠️ ENTROPY ANOMALY: High entropy ({entropy:.4f}) detected - suggests possible hidden data or encryption."
-                    warn_item = QTreeWidgetItem(stegano_root, ["⚠️ High Entropy", warning])
-                    warn_item.setForeground(0, QColor("orange"))
-                    self.anomalies.append(f"File '{base_name}': {warning}")
+                    warn_item = QTreeWidgetItem(["⚠️ High Entropy", warning])
+                    warn_item.setForeground(0, self._C_ORANGE)
+                    pending.append(warn_item)
+                    anomalies.append(f"File '{base_name}': {warning}")
                     has_stegano_findings = True
                 else:
-                     QTreeWidgetItem(stegano_root, ["Entropy Status", "Entropy within expected range."])
+                     pending.append(QTreeWidgetItem(["Entropy Status", "Entropy within expected range."]))
 
             except FileNotFoundError:
-                 QTreeWidgetItem(stegano_root, ["Entropy Calculation Error", "File not found for entropy calculation."]).setForeground(1, QColor("red"))
-                 self.anomalies.append(f"File '{base_name}': File not found during entropy calculation.")
+                 error_item = QTreeWidgetItem(["Entropy Calculation Error", "File not found for entropy calculation."])
+                 error_item.setForeground(1, self._C_RED)
+                 pending.append(error_item)
+                 anomalies.append(f"File '{base_name}': File not found during entropy calculation.")
                  has_stegano_findings = True
             except Exception as e:
-                QTreeWidgetItem(stegano_root, ["Entropy Calculation Error", f"Failed to calculate entropy: {e}"]).setForeground(1, QColor("red"))
-                self.anomalies.append(f"File '{base_name}': Error calculating entropy - {e}")
+                error_item = QTreeWidgetItem(["Entropy Calculation Error", f"Failed to calculate entropy: {e}"])
+                error_item.setForeground(1, self._C_RED)
+                pending.append(error_item)
+                anomalies.append(f"File '{base_name}': Error calculating entropy - {e}")
                 has_stegano_findings = True
         else:
-            QTreeWidgetItem(stegano_root, ["Entropy Analysis", "Skipped (only applicable to image files)."])
+            pending.append(QTreeWidgetItem(["Entropy Analysis", "Skipped (only applicable to image files)."]))
 
 
-        if stegano_root.childCount() == 0:
-             QTreeWidgetItem(stegano_root, ["Status", "Analysis performed, no steganography indicators found."])
-        elif not has_stegano_findings and stegano_root.childCount() > 0:
-             child_texts = [stegano_root.child(i).text(0) for i in range(stegano_root.childCount())]
+        if not pending:
+             pending.append(QTreeWidgetItem(["Status", "Analysis performed, no steganography indicators found."]))
+        elif not has_stegano_findings:
+             child_texts = [item.text(0) for item in pending]
              if not any("⚠️" in text or "🚨" in text or "Error" in text for text in child_texts):
-                 QTreeWidgetItem(stegano_root, ["Status", "Analysis performed, no steganography anomalies detected."])
-    def calculate_entropy(self, file_path):
-        try:
-            with open(file_path, 'rb') as f:
-                byte_data = f.read()
-        except Exception as e:
-            print(f"Error reading file for entropy calculation: {e}")
-            return 0.0
-
-        if not byte_data:
-            return 0.0
+                 pending.append(QTreeWidgetItem(["Status", "Analysis performed, no steganography anomalies detected."]))
 
-        byte_counts = Counter(byte_data)
-        total_bytes = len(byte_data)
-
-        entropy = 0.0
-        for count in byte_counts.values():
-            if count > 0:
-                probability = count / total_bytes
-                entropy -= probability * math.log2(probability)
+        stegano_root.addChildren(pending)
+    def calculate_entropy(self, file_path):
+        """Whole-file byte entropy. Read failures propagate so the caller reports an error row
+        rather than a 0.0 that would read as a clean result."""
+        st = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), st.st_size, st.st_mtime_ns)
+        with self._entropy_cache_lock:
+            entropy = self._entropy_cache.get(cache_key)
+            if entropy is not None:
+                self._entropy_cache.move_to_end(cache_key)
+                return entropy
+
+        if _optional_import("numpy") is not None:
+            counts, total_bytes = _mmap_byte_histogram(file_path)
+        else:
+            counts, total_bytes = _byte_histogram(_iter_chunks(file_path))
 
+        entropy = _histogram_entropy(counts, total_bytes)
+        with self._entropy_cache_lock:
+            self._entropy_cache[cache_key] = entropy
+            if len(self._entropy_cache) > _ENTROPY_CACHE_SIZE:
+                self._entropy_cache.popitem(last=False)
         return entropy
+
     def toggle_theme(self):
         if self.theme_toggle_btn.text().startswith(" Switch to Dark"):
             self.theme_toggle_btn.setText(" Switch to Light Theme")
@@ -906,7 +1349,13 @@ class MetadataAnalyzerApp(QMainWindow):
             self.theme_toggle_btn.setIcon(get_icon('theme'))
             self.apply_light_theme()
     def apply_light_theme(self):
-        self.setStyleSheet(f"""
+        self.setStyleSheet(self._qss_light)
+
+    def apply_dark_theme(self):
+        self.setStyleSheet(self._qss_dark)
+
+    def _build_light_qss(self):
+        return f"""
         QMainWindow, QDialog {{
             background-color: {self.COLOR_PALETTE['lightest']};
         }}
@@ -1032,10 +1481,10 @@ class MetadataAnalyzerApp(QMainWindow):
             background: {self.COLOR_PALETTE['lightest']};
             border: 1px solid {self.COLOR_PALETTE['light']};
         }}
-        """           )
+        """
 
-    def apply_dark_theme(self):
-        self.setStyleSheet(f"""
+    def _build_dark_qss(self):
+        return f"""
         QMainWindow, QDialog {{
             background-color: {self.COLOR_PALETTE['darkest']};
         }}
@@ -1163,7 +1612,7 @@ class MetadataAnalyzerApp(QMainWindow):
             background: {self.COLOR_PALETTE['darkest']};
             border: 1px solid {self.COLOR_PALETTE['dark']};
         }}
-        """           )
+        """
 
     def set_controls_enabled(self, enabled):
         self.select_files_btn.setEnabled(enabled)
@@ -1199,14 +1648,14 @@ class MetadataAnalyzerApp(QMainWindow):
         folder = QFileDialog.getExistingDirectory(self, "Select Folder")
         if folder:
             self.file_paths = []
-            supported_extensions = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".pdf", ".docx", ".mp3", ".mp4")
 
             try:
-                for entry in os.scandir(folder):
-                    if entry.is_file() and entry.name.lower().endswith(supported_extensions):
-                        abs_path = os.path.abspath(entry.path)
-                        self.file_paths.append(abs_path)
-
+                # The dialog returns an absolute folder, so entry.path is already absolute.
+                with os.scandir(folder) as entries:
+                    self.file_paths = [
+                        entry.path for entry in entries
+                        if os.path.splitext(entry.name)[1].lower() in _SUPPORTED_EXTENSIONS and entry.is_file()
+                    ]
 
                 if hasattr(self, 'tree'):
                     self.tree.file_path_map = {os.path.basename(path): path for path in self.file_paths}
@@ -1238,7 +1687,9 @@ class MetadataAnalyzerApp(QMainWindow):
         self.anomalies = []
         self.logical_issues = []
         self.tree.clear()
+        self._search_index = []
         self.preview_widget.clear_preview()
+        self.current_file_path = None
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
 
@@ -1249,106 +1700,153 @@ class MetadataAnalyzerApp(QMainWindow):
 
         self.status_bar.showMessage(f"Starting analysis of {len(self.file_paths)} files...")
         self.set_controls_enabled(False)
-        QApplication.processEvents()
-        self.processing_timer.start()
 
-    def process_next_file(self):
-        try:
-            if self.current_file_index >= len(self.file_paths):
-                self.processing_timer.stop()
-                self.finish_analysis()
-                return
-
-            file_path = self.file_paths[self.current_file_index]
-            self.current_file_path = file_path
-            base_name = os.path.basename(file_path)
-
-
-            self.update_preview(file_path)
-
-            file_item = QTreeWidgetItem(self.tree, [base_name])
-            file_stats = None
+        self._pending_results = {}
+        self._completed_count = 0
+        self._analysis_cancelled.clear()
+        # Widgets must only be touched on the GUI thread, so read the checkbox once here.
+        check_stegano = self.check_stegano_checkbox.isChecked()
+        for index, file_path in enumerate(self.file_paths):
+            self._analysis_pool.start(FileAnalyzeTask(self, index, file_path, check_stegano))
+        self._flush_timer.start()
+
+    def _on_file_analyzed(self, index, result):
+        """Receives a finished (item, anomalies, issues) result from a worker; it is attached on the next flush."""
+        self._pending_results[index] = result
+        self._completed_count += 1
+
+    def _flush_analyzed_files(self):
+        """Attaches finished items to the tree in file order and updates progress."""
+        total_files = len(self.file_paths)
+        flushed = []
+        while self.current_file_index in self._pending_results:
+            file_item, anomalies, logical_issues = self._pending_results.pop(self.current_file_index)
+            flushed.append(file_item)
+            # Merged here, in file order, so the GUI thread is the only writer of the shared lists.
+            self.anomalies.extend(anomalies)
+            self.logical_issues.extend(logical_issues)
+            self.current_file_index += 1
 
+        if flushed:
+            self.tree.setUpdatesEnabled(False)
             try:
-                file_stats = os.stat(file_path)
-                self.add_basic_file_info(file_path, file_item, file_stats)
-
+                self.tree.addTopLevelItems(flushed)
+            finally:
+                self.tree.setUpdatesEnabled(True)
+            for file_item in flushed:
+                self._index_subtree(file_item)
+
+        progress_percent = int((self._completed_count / total_files) * 100)
+        self.progress_bar.setValue(progress_percent)
+        if flushed:
+            self.status_bar.showMessage(f"Analyzing: {flushed[-1].text(0)} ({self._completed_count}/{total_files})")
+
+        if self.current_file_index >= total_files:
+            self._flush_timer.stop()
+            self.finish_analysis()
+
+    def _index_subtree(self, top_item):
+        """Appends every item under top_item (inclusive) to the flat search index."""
+        index = self._search_index
+        stack = [top_item]
+        while stack:
+            item = stack.pop()
+            # Columns are joined with a unit separator so a match can't straddle them.
+            text = f"{item.text(0)}\x1f{item.text(1)}"
+            child_count = item.childCount()
+            index.append((top_item, item, child_count, text, text.casefold()))
+            for i in range(child_count - 1, -1, -1):
+                stack.append(item.child(i))
+
+    def analyze_file(self, file_path, check_stegano):
+        """Builds the metadata subtree for one file. Runs on a worker thread.
+
+        Returns (file_item, anomalies, logical_issues); the GUI thread merges the
+        per-file lists in file order when it attaches the item.
+        """
+        base_name = os.path.basename(file_path)
+        anomalies, logical_issues = [], []
+        # Lowercased once here and handed to the checks that branch on it.
+        ext = os.path.splitext(base_name)[1].lower()
 
-                sig_warning = self.check_file_signature_mismatch(file_path)
-                if sig_warning:
-                    alert_item = QTreeWidgetItem(file_item, ["🚨 SIGNATURE MISMATCH", sig_warning])
-                    alert_item.setForeground(0, QColor("red"))
-                    alert_item.setForeground(1, QColor("red"))
-                    self.anomalies.append(f"{base_name}: {sig_warning}")
+        # Build the file's subtree detached; the GUI thread attaches it in one insert.
+        file_item = QTreeWidgetItem([base_name])
+        file_stats = None
 
+        try:
+            file_stats = os.stat(file_path)
+            self.add_basic_file_info(file_path, file_item, file_stats, base_name, ext, anomalies, logical_issues)
 
-                size_warnings = self.check_file_size_anomalies(file_path, file_stats)
-                for warning in size_warnings:
-                    warn_item = QTreeWidgetItem(file_item, ["⚠️ SIZE WARNING", warning])
-                    warn_item.setForeground(0, QColor("orange"))
-                    self.anomalies.append(f"{base_name}: {warning}")
 
-            except Exception as e:
-                self.anomalies.append(f"{base_name}: Error reading file system stats - {e}")
-                fs_info_root = QTreeWidgetItem(file_item, ["File System Info"])
-                QTreeWidgetItem(fs_info_root, ["Error", f"Could not read stats: {e}"]).setForeground(1, QColor("red"))
-                file_stats = None
+            sig_warning = self.check_file_signature_mismatch(file_path, ext)
+            if sig_warning:
+                alert_item = QTreeWidgetItem(file_item, ["🚨 SIGNATURE MISMATCH", sig_warning])
+                alert_item.setForeground(0, self._C_RED)
+                alert_item.setForeground(1, self._C_RED)
+                anomalies.append(f"{base_name}: {sig_warning}")
 
-            lower_path = file_path.lower()
-            try:
-                file_type = None
-                if Image and lower_path.endswith((".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff")):
-                    file_type = "image"
-                    self.process_image_exif(file_path, file_item, file_stats)
-
-                    # Added Steganography Check for images
-                    if self.check_stegano_checkbox.isChecked():
-                         self.check_steganography(file_path, file_item)
-
-                elif PyPDF2 and lower_path.endswith(".pdf"):
-                    file_type = "pdf"
-                    self.process_pdf(file_path, file_item, file_stats)
-                elif Document and lower_path.endswith(".docx"):
-                    file_type = "docx"
-                    self.process_docx(file_path, file_item, file_stats)
-                elif mutagen and lower_path.endswith((".mp3", ".mp4")):
-                    file_type = "media"
-                    self.process_media(file_path, file_item, file_stats)
-                elif file_stats is not None:
-                    has_specific_metadata = False
-                    for i in range(file_item.childCount()):
-                        child_text = file_item.child(i).text(0)
-                        if child_text not in ["File System Info", "Status", "Processing Error", "Steganography Analysis"]: # Added Steganography Analysis here
-                            has_specific_metadata = True
-                            break
-                    if not has_specific_metadata:
-                        unsupported_item = QTreeWidgetItem(file_item, ["Status", "Unsupported file type or required library missing."])
-                        unsupported_item.setForeground(1, QColor("orange"))
-
-
-                if file_type:
-                    metadata = {}
-                    self.tree._collect_metadata_dict(file_item, metadata)
-                    author_warnings = self.check_suspicious_authors(metadata, file_type)
-                    for warning in author_warnings:
-                        auth_item = QTreeWidgetItem(file_item, ["🔍 AUTHOR WARNING", warning])
-                        auth_item.setForeground(0, QColor(139, 0, 139))
-                        self.logical_issues.append(f"{base_name}: {warning}")
-
-            except Exception as proc_err:
-                self.anomalies.append(f"{base_name}: Unexpected error during processing - {proc_err}")
-                error_item = QTreeWidgetItem(file_item, ["Processing Error", str(proc_err)])
-                error_item.setForeground(1, QColor("red"))
 
-            self.current_file_index += 1
-            progress_percent = int((self.current_file_index / len(self.file_paths)) * 100)
-            self.progress_bar.setValue(progress_percent)
-            self.status_bar.showMessage(f"Analyzing: {base_name} ({self.current_file_index}/{len(self.file_paths)})")
+            size_warnings = self.check_file_size_anomalies(file_path, file_stats, ext)
+            for warning in size_warnings:
+                warn_item = QTreeWidgetItem(file_item, ["⚠️ SIZE WARNING", warning])
+                warn_item.setForeground(0, self._C_ORANGE)
+                anomalies.append(f"{base_name}: {warning}")
 
         except Exception as e:
-            QApplication.restoreOverrideCursor()
-            self.status_bar.showMessage(f"Error during processing: {str(e)}")
-            self.processing_timer.stop()
+            anomalies.append(f"{base_name}: Error reading file system stats - {e}")
+            fs_info_root = QTreeWidgetItem(file_item, ["File System Info"])
+            QTreeWidgetItem(fs_info_root, ["Error", f"Could not read stats: {e}"]).setForeground(1, self._C_RED)
+            file_stats = None
+
+        try:
+            file_type = None
+            handler_entry = self._ext_handlers.get(ext)
+            if handler_entry and _optional_import(handler_entry[1]):
+                file_type, _, handler = handler_entry
+                handler(file_path, file_item, file_stats, base_name, ext, anomalies, logical_issues)
+
+                # Added Steganography Check for images
+                if file_type == "image" and check_stegano:
+                     self.check_steganography(file_path, file_item, base_name, ext, anomalies)
+
+            elif file_stats is not None:
+                has_specific_metadata = False
+                for i in range(file_item.childCount()):
+                    child_text = file_item.child(i).text(0)
+                    if child_text not in _GENERIC_GROUPS:
+                        has_specific_metadata = True
+                        break
+                if not has_specific_metadata:
+                    unsupported_item = QTreeWidgetItem(file_item, ["Status", "Unsupported file type or required library missing."])
+                    unsupported_item.setForeground(1, self._C_ORANGE)
+
+
+            if file_type:
+                metadata = {}
+                self.tree._collect_metadata_dict(file_item, metadata)
+                author_warnings = self.check_suspicious_authors(metadata, file_type)
+                for warning in author_warnings:
+                    auth_item = QTreeWidgetItem(file_item, ["🔍 AUTHOR WARNING", warning])
+                    auth_item.setForeground(0, self._C_PURPLE)
+                    logical_issues.append(f"{base_name}: {warning}")
+
+        except Exception as proc_err:
+            anomalies.append(f"{base_name}: Unexpected error during processing - {proc_err}")
+            error_item = QTreeWidgetItem(file_item, ["Processing Error", str(proc_err)])
+            error_item.setForeground(1, self._C_RED)
+
+        return file_item, anomalies, logical_issues
+
+    def _on_current_item_changed(self, current, previous):
+        """Previews the file that owns the newly selected row."""
+        if current is None:
+            return
+        while current.parent():
+            current = current.parent()
+        file_path = self.tree.file_path_map.get(current.text(0))
+        if file_path and file_path != self.current_file_path:
+            self.current_file_path = file_path
+            self.update_preview(file_path)
 
     def update_preview(self, file_path):
         """Updates the preview panel based on file type."""
@@ -1356,14 +1854,14 @@ class MetadataAnalyzerApp(QMainWindow):
             self.preview_widget.clear_preview()
             return
 
-        lower_path = file_path.lower()
+        ext = os.path.splitext(file_path)[1].lower()
 
         try:
-            if lower_path.endswith((".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff")):
+            if ext in _IMAGE_EXTENSIONS:
                 self.preview_widget.set_image_preview(file_path)
-            elif lower_path.endswith(".pdf"):
+            elif ext == ".pdf":
                 self.preview_widget.set_pdf_preview(file_path)
-            elif lower_path.endswith((".mp3", ".mp4")):
+            elif ext in _MEDIA_EXTENSIONS:
                 self.preview_widget.set_video_preview(file_path)
             else:
                 self.preview_widget.clear_preview()
@@ -1381,6 +1879,11 @@ class MetadataAnalyzerApp(QMainWindow):
                 self.status_bar.showMessage(f"Error opening file: {e}")
 
     def filter_metadata(self):
+        """Schedules a filter pass; restarting the timer folds a burst of edits into one."""
+        self._search_debounce.start()
+
+    def _do_filter_metadata(self):
+        self._search_debounce.stop()
         search_text = self.search_box.text()
         case_sensitive = self.case_sensitive_checkbox.isChecked()
 
@@ -1396,7 +1899,7 @@ class MetadataAnalyzerApp(QMainWindow):
                     group_item = top_item.child(j)
                     group_name = group_item.text(0)
 
-                    if group_name in ["File System Info", "EXIF Metadata", "PDF Metadata", "DOCX Metadata", "Media Metadata", "GPS Info", "Steganography Analysis"]: # Added Steganography Analysis here
+                    if group_name in _AUTO_EXPANDED_GROUPS:
                         group_item.setExpanded(True)
                     else:
                         group_item.setExpanded(False)
@@ -1404,37 +1907,19 @@ class MetadataAnalyzerApp(QMainWindow):
             return
 
         matched_top_level_items = set()
+        compare_search = search_text if case_sensitive else search_text.casefold()
 
-        iterator = QTreeWidgetItemIterator(self.tree, QTreeWidgetItemIterator.IteratorFlag.All)
-        while iterator.value():
-            item = iterator.value()
-            match_found = False
-            for col in range(item.columnCount()):
-                item_text = item.text(col)
-                if item_text:
-                    compare_item_text = item_text if case_sensitive else item_text.lower()
-                    compare_search = search_text if case_sensitive else search_text.lower()
-                    if compare_search in compare_item_text:
-                        match_found = True
-                        break
-
-            if match_found:
+        for top_item, item, child_count, text, folded_text in self._search_index:
+            if compare_search in (text if case_sensitive else folded_text):
+                matched_top_level_items.add(top_item.text(0))
 
-                top_item_ancestor = item
-                while top_item_ancestor.parent():
-                    top_item_ancestor = top_item_ancestor.parent()
-                matched_top_level_items.add(top_item_ancestor.text(0))
-
-
-                if item.childCount() > 0:
+                if child_count > 0:
                     item.setExpanded(True)
                 parent = item.parent()
                 while parent:
                     parent.setExpanded(True)
                     parent = parent.parent()
 
-            iterator += 1
-
 
         for i in range(self.tree.topLevelItemCount()):
             top_item = self.tree.topLevelItem(i)
@@ -1484,12 +1969,12 @@ class MetadataAnalyzerApp(QMainWindow):
                     group_name = group_item.text(0)
 
 
-                    if group_name in ["File System Info", "EXIF Metadata", "PDF Metadata", "DOCX Metadata", "Media Metadata", "GPS Info", "Steganography Analysis"]: # Added Steganography Analysis here
+                    if group_name in _AUTO_EXPANDED_GROUPS:
                         group_item.setExpanded(True)
 
 
         if self.search_box.text():
-            self.filter_metadata()
+            self._do_filter_metadata()
 
     @staticmethod
     def format_size(size_bytes):
@@ -1497,19 +1982,15 @@ class MetadataAnalyzerApp(QMainWindow):
             return "N/A"
         if size_bytes < 1024:
             return f"{size_bytes} B"
-        elif size_bytes < 1024**2:
-            return f"{size_bytes/1024:.1f} KiB"
-        elif size_bytes < 1024**3:
-            return f"{size_bytes/1024**2:.1f} MiB"
-        else:
-            return f"{size_bytes/1024**3:.1f} GiB"
+        # Each unit is 10 bits, so the bit length picks the unit without a comparison chain.
+        unit = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
 
-    def add_basic_file_info(self, file_path, parent_item, stats):
-        base_name = os.path.basename(file_path)
+    def add_basic_file_info(self, file_path, parent_item, stats, base_name, ext, anomalies, logical_issues):
         fs_info_root = QTreeWidgetItem(parent_item, ["File System Info"])
 
         if stats is None:
-            QTreeWidgetItem(fs_info_root, ["Error", "Could not read file system statistics."]).setForeground(1, QColor("red"))
+            QTreeWidgetItem(fs_info_root, ["Error", "Could not read file system statistics."]).setForeground(1, self._C_RED)
             return
 
         creation_dt, modification_dt, access_dt = None, None, None
@@ -1533,12 +2014,12 @@ class MetadataAnalyzerApp(QMainWindow):
                 modification_dt = datetime.fromtimestamp(ts_mod, tz=timezone.utc).astimezone()
                 access_dt = datetime.fromtimestamp(ts_acc, tz=timezone.utc).astimezone()
                 creation_dt = datetime.fromtimestamp(ts_cre, tz=timezone.utc).astimezone()
-                dt_format = "%Y-%m-%d %H:%M:%S %Z%z"
+                dt_format = self._DT_FORMAT
             except (OSError, ValueError):
                 modification_dt = datetime.fromtimestamp(ts_mod)
                 access_dt = datetime.fromtimestamp(ts_acc)
                 creation_dt = datetime.fromtimestamp(ts_cre)
-                dt_format = "%Y-%m-%d %H:%M:%S (Local?)"
+                dt_format = self._DT_FORMAT_NAIVE
 
             modification_time_str = modification_dt.strftime(dt_format)
             access_time_str = access_dt.strftime(dt_format)
@@ -1553,40 +2034,32 @@ class MetadataAnalyzerApp(QMainWindow):
                 tolerance = timedelta(seconds=2)
 
                 if modification_dt < creation_dt - tolerance:
-                    self.logical_issues.append(f"{issue_prefix} Modified ({modification_time_str}) significantly before Created ({creation_time_str})")
+                    logical_issues.append(f"{issue_prefix} Modified ({modification_time_str}) significantly before Created ({creation_time_str})")
 
                 if access_dt < creation_dt - tolerance:
-                    self.logical_issues.append(f"{issue_prefix} Accessed ({access_time_str}) significantly before Created ({creation_time_str})")
+                    logical_issues.append(f"{issue_prefix} Accessed ({access_time_str}) significantly before Created ({creation_time_str})")
 
 
             if file_size == 0:
-                self.logical_issues.append(f"File '{base_name}': File size is 0 bytes (empty file).")
+                logical_issues.append(f"File '{base_name}': File size is 0 bytes (empty file).")
 
         except Exception as e:
-            self.anomalies.append(f"{base_name}: Error processing file system stats - {e}")
+            anomalies.append(f"{base_name}: Error processing file system stats - {e}")
             creation_time_str = modification_time_str = access_time_str = "Error processing"
             size_str = "Error processing"
-            QTreeWidgetItem(fs_info_root, ["Error", f"Could not process timestamps/size: {e}"]).setForeground(1, QColor("red"))
+            QTreeWidgetItem(fs_info_root, ["Error", f"Could not process timestamps/size: {e}"]).setForeground(1, self._C_RED)
 
         QTreeWidgetItem(fs_info_root, ["File Size", size_str])
         QTreeWidgetItem(fs_info_root, ["Created", creation_time_str])
         QTreeWidgetItem(fs_info_root, ["Modified", modification_time_str])
         QTreeWidgetItem(fs_info_root, ["Accessed", access_time_str])
-        QTreeWidgetItem(fs_info_root, ["Extension", os.path.splitext(file_path)[1]])
+        QTreeWidgetItem(fs_info_root, ["Extension", ext])
 
     def _parse_exif_datetime(self, dt_str):
         if not dt_str or not isinstance(dt_str, str):
             return None
-        try:
-
-            return datetime.strptime(dt_str, '%Y:%m:%d %H:%M:%S')
-        except ValueError:
-            try:
-
-                return datetime.strptime(dt_str.rstrip('\x00').strip(), '%Y:%m:%d %H:%M:%S')
-            except ValueError:
-                print(f"Warning: Could not parse EXIF datetime string: '{dt_str}'")
-                return None
+        # Strip padding before the cache so equivalent stamps collapse to one key.
+        return _parse_exif_datetime_str(dt_str.translate(_NUL_STRIP_TABLE).strip())
 
     def _parse_gps_info(self, exif_data):
         """Parses GPS information from EXIF data."""
@@ -1595,9 +2068,9 @@ class MetadataAnalyzerApp(QMainWindow):
             return gps_info
 
 
-        for tag, value in exif_data.items():
-            decoded = GPSTAGS.get(tag, tag)
-            gps_info[decoded] = value
+        from PIL.ExifTags import GPSTAGS
+        gps_tag_name = GPSTAGS.get
+        gps_info = {gps_tag_name(tag, tag): value for tag, value in exif_data.items()}
 
         latitude = None
         longitude = None
@@ -1649,13 +2122,13 @@ class MetadataAnalyzerApp(QMainWindow):
 
         return gps_info
 
-    def process_image_exif(self, file_path, parent_item, stats):
-        base_name = os.path.basename(file_path)
-        if not Image or not TAGS or not UnidentifiedImageError:
-            QTreeWidgetItem(parent_item, ["EXIF Status", "Pillow library missing or incomplete."]).setForeground(1, QColor("orange"))
+    def process_image_exif(self, file_path, parent_item, stats, base_name, ext, anomalies, logical_issues):
+        Image = _optional_import("PIL.Image")
+        if not Image:
+            QTreeWidgetItem(parent_item, ["EXIF Status", "Pillow library missing or incomplete."]).setForeground(1, self._C_ORANGE)
             return
+        from PIL.ExifTags import TAGS
 
-        encodings_to_try = ['utf-8', 'ascii', 'latin-1', 'windows-1252', 'utf-16le', 'utf-16be', 'shift_jis', 'cp437']
         exif_root = QTreeWidgetItem(parent_item, ["EXIF Metadata"])
         has_exif_content = False
         exif_values = {}
@@ -1663,22 +2136,21 @@ class MetadataAnalyzerApp(QMainWindow):
         fs_creation_dt, fs_modification_dt = None, None
         if stats:
             try:
-                fs_modification_dt = datetime.fromtimestamp(stats.st_mtime)
-                ts_cre = stats.st_ctime
-                if hasattr(stats, 'st_birthtime') and stats.st_birthtime:
-                    ts_cre = stats.st_birthtime
-                fs_creation_dt = datetime.fromtimestamp(ts_cre)
+                fs_creation_dt, fs_modification_dt = _fs_times(stats)
             except Exception as fs_e:
                 print(f"Warning: Could not extract filesystem times for comparison in {base_name}: {fs_e}")
 
         try:
+            # Image.open only parses the headers; EXIF is available without decoding
+            # the pixel data, so don't load() here.
             with Image.open(file_path) as image:
-
-                image.load()
                 exif_data = image.getexif()
 
                 if exif_data:
                     found_tags = set()
+                    # Tag rows are built unparented and attached in one addChildren() call.
+                    tag_items = []
+                    dt_orig = dt_digi = None
                     for tag_id, value in exif_data.items():
                         tag_name = TAGS.get(tag_id, f"Unknown Tag ({tag_id})")
                         found_tags.add(tag_name)
@@ -1688,26 +2160,33 @@ class MetadataAnalyzerApp(QMainWindow):
 
                         if isinstance(value, bytes):
                             successfully_decoded = False
-                            for encoding in encodings_to_try:
-                                try:
-                                    value_str = value.decode(encoding, errors='ignore').rstrip('\x00').strip()
-
-                                    if value_str.startswith('\ufeff'):
-                                        value_str = value_str[1:]
-
-                                    if value_str and not all(c in ('\x00', '\ufffd') for c in value_str):
-                                        successfully_decoded = True
-                                        break
-                                except Exception:
-                                    continue
+                            # Most byte tags (make, model, serial) are plain ASCII, which every
+                            # candidate encoding would decode identically; settle those at once.
+                            if value.isascii():
+                                value_str = value.decode('ascii').translate(_NUL_STRIP_TABLE).strip()
+                                successfully_decoded = bool(value_str) and not _BAD_CHARS.issuperset(value_str)
+                            if not successfully_decoded:
+                                for encoding in _EXIF_ENCODINGS:
+                                    try:
+                                        value_str = value.decode(encoding, errors='ignore').translate(_NUL_STRIP_TABLE).strip().lstrip('\ufeff')
+
+                                        if value_str and not _BAD_CHARS.issuperset(value_str):
+                                            successfully_decoded = True
+                                            break
+                                    except Exception:
+                                        continue
                             if not successfully_decoded:
                                 value_str = repr(value)
                         elif isinstance(value, str):
-                            value_str = value.rstrip('\x00').strip()
+                            value_str = value.translate(_NUL_STRIP_TABLE).strip()
                         else:
                             value_str = str(value).rstrip('\x00')
 
                         exif_values[tag_name] = value_str
+                        if tag_name == "DateTimeOriginal":
+                            dt_orig = self._parse_exif_datetime(value_str)
+                        elif tag_name == "DateTimeDigitized":
+                            dt_digi = self._parse_exif_datetime(value_str)
 
 
                         max_len = 200
@@ -1715,74 +2194,70 @@ class MetadataAnalyzerApp(QMainWindow):
                         if len(display_value) > max_len:
                             display_value = display_value[:max_len] + "..."
 
-                        QTreeWidgetItem(exif_root, [str(tag_name), display_value])
+                        tag_items.append(QTreeWidgetItem([str(tag_name), display_value]))
 
+                    exif_root.addChildren(tag_items)
 
-                    gps_ifd = exif_data.get_ifd(0x8825) if hasattr(exif_data, 'get_ifd') else {}
-                    gps_info = self._parse_gps_info(gps_ifd)
+                    # Only images that carry a GPSInfo pointer (0x8825) have an IFD worth parsing.
+                    has_gps = 0x8825 in exif_data and hasattr(exif_data, 'get_ifd')
+                    gps_info = self._parse_gps_info(exif_data.get_ifd(0x8825)) if has_gps else {}
                     if gps_info:
                         gps_root = QTreeWidgetItem(exif_root, ["GPS Info"])
-                        for key, value in gps_info.items():
-
-                            if key in ['GPSLatitudeDec', 'GPSLongitudeDec', 'GPSAltitude', 'GPSPosition', 'GPSTimestamp', 'GPSDateStamp', 'GPSProcessingMethod', 'GPSParsingError']:
-                                QTreeWidgetItem(gps_root, [str(key), str(value)])
+                        gps_root.addChildren([
+                            QTreeWidgetItem([str(key), str(value)])
+                            for key, value in gps_info.items() if key in _GPS_DISPLAY_KEYS
+                        ])
 
                     if 'SerialNumber' in exif_values:
                         serial_item = QTreeWidgetItem(exif_root, ["Camera Serial Number", exif_values['SerialNumber']])
-                        serial_item.setForeground(0, QColor(0, 100, 0))
-                        self.logical_issues.append(f"File '{base_name}': Camera serial number found - {exif_values['SerialNumber']}")
+                        serial_item.setForeground(0, self._C_GREEN)
+                        logical_issues.append(f"File '{base_name}': Camera serial number found - {exif_values['SerialNumber']}")
 
 
                     if 'Software' in exif_values:
-                        software = exif_values['Software'].lower()
-                        if 'photoshop' in software or 'editor' in software:
+                        if _EDITOR_SOFTWARE_RE.search(exif_values['Software']):
                             warn_item = QTreeWidgetItem(exif_root, ["⚠️ EDITING SOFTWARE", exif_values['Software']])
-                            warn_item.setForeground(0, QColor("orange"))
-                            self.anomalies.append(f"File '{base_name}': Edited with {exif_values['Software']}")
-
+                            warn_item.setForeground(0, self._C_ORANGE)
+                            anomalies.append(f"File '{base_name}': Edited with {exif_values['Software']}")
 
-                    dt_orig_str = exif_values.get("DateTimeOriginal")
-                    dt_digi_str = exif_values.get("DateTimeDigitized")
-                    dt_orig = self._parse_exif_datetime(dt_orig_str)
-                    dt_digi = self._parse_exif_datetime(dt_digi_str)
 
                     if dt_orig or dt_digi or fs_creation_dt or fs_modification_dt:
                         issue_prefix = f"File '{base_name}' - EXIF Time Issue:"
                         if dt_orig and dt_digi and dt_orig > dt_digi:
-                            self.logical_issues.append(f"{issue_prefix} DateTimeOriginal ({dt_orig}) is after DateTimeDigitized ({dt_digi})")
+                            logical_issues.append(f"{issue_prefix} DateTimeOriginal ({dt_orig}) is after DateTimeDigitized ({dt_digi})")
                         if dt_orig and fs_modification_dt and dt_orig > fs_modification_dt + timedelta(minutes=1):
-                            self.logical_issues.append(f"{issue_prefix} DateTimeOriginal ({dt_orig}) is significantly after Filesystem Modified ({fs_modification_dt.strftime('%Y-%m-%d %H:%M:%S')}) - Suggests file modification after capture.")
+                            logical_issues.append(f"{issue_prefix} DateTimeOriginal ({dt_orig}) is significantly after Filesystem Modified ({fs_modification_dt.strftime('%Y-%m-%d %H:%M:%S')}) - Suggests file modification after capture.")
                         if dt_orig and fs_creation_dt and dt_orig < fs_creation_dt - timedelta(minutes=1):
-                            self.logical_issues.append(f"File '{base_name}' - EXIF Note: DateTimeOriginal ({dt_orig}) is significantly before Filesystem Created ({fs_creation_dt.strftime('%Y-%m-%d %H:%M:%S')}) - May indicate copying or timestamp manipulation.")
+                            logical_issues.append(f"File '{base_name}' - EXIF Note: DateTimeOriginal ({dt_orig}) is significantly before Filesystem Created ({fs_creation_dt.strftime('%Y-%m-%d %H:%M:%S')}) - May indicate copying or timestamp manipulation.")
 
 
                     required_tags = ["DateTimeOriginal", "Make", "Model"]
                     missing_tags = [tag for tag in required_tags if tag not in found_tags]
                     if missing_tags:
                         missing_item = QTreeWidgetItem(exif_root, ["⚠️ MISSING TAGS", ", ".join(missing_tags)])
-                        missing_item.setForeground(0, QColor("orange"))
-                        self.anomalies.append(f"File '{base_name}': Missing common EXIF tags: {', '.join(missing_tags)}")
+                        missing_item.setForeground(0, self._C_ORANGE)
+                        anomalies.append(f"File '{base_name}': Missing common EXIF tags: {', '.join(missing_tags)}")
 
                 if not has_exif_content:
                     QTreeWidgetItem(exif_root, ["Status", "No EXIF data found."])
 
-                    if file_path.lower().endswith(('.jpg', '.jpeg', '.png')):
-                        self.anomalies.append(f"File '{base_name}': No EXIF data found in image file - may be stripped or edited")
+                    if ext in _EXIF_EXPECTED_EXTENSIONS:
+                        anomalies.append(f"File '{base_name}': No EXIF data found in image file - may be stripped or edited")
 
         except FileNotFoundError:
-            self.anomalies.append(f"{base_name}: File not found during EXIF processing.")
-            QTreeWidgetItem(exif_root, ["Error", "File not found."]).setForeground(1, QColor("red"))
-        except UnidentifiedImageError:
-            self.anomalies.append(f"{base_name}: Cannot identify image file (may be corrupt or unsupported format).")
-            QTreeWidgetItem(exif_root, ["Error", "Cannot identify image file."]).setForeground(1, QColor("orange"))
+            anomalies.append(f"{base_name}: File not found during EXIF processing.")
+            QTreeWidgetItem(exif_root, ["Error", "File not found."]).setForeground(1, self._C_RED)
+        except Image.UnidentifiedImageError:
+            anomalies.append(f"{base_name}: Cannot identify image file (may be corrupt or unsupported format).")
+            QTreeWidgetItem(exif_root, ["Error", "Cannot identify image file."]).setForeground(1, self._C_ORANGE)
         except Exception as e:
-            self.anomalies.append(f"{base_name}: Error processing image EXIF - {e}")
-            QTreeWidgetItem(exif_root, ["Error", f"EXIF processing failed: {e}"]).setForeground(1, QColor("red"))
+            anomalies.append(f"{base_name}: Error processing image EXIF - {e}")
+            QTreeWidgetItem(exif_root, ["Error", f"EXIF processing failed: {e}"]).setForeground(1, self._C_RED)
 
-    def process_pdf(self, file_path, parent_item, stats):
-        base_name = os.path.basename(file_path)
+    def process_pdf(self, file_path, parent_item, stats, base_name, ext, anomalies, logical_issues):
+        PyPDF2 = _optional_import("PyPDF2")
         if not PyPDF2:
-            QTreeWidgetItem(parent_item, ["PDF Status", "PyPDF2 library missing."]).setForeground(1, QColor("orange"))
+            QTreeWidgetItem(parent_item, ["PDF Status", "PyPDF2 library missing."]).setForeground(1, self._C_ORANGE)
             return
 
         pdf_root = QTreeWidgetItem(parent_item, ["PDF Metadata"])
@@ -1792,11 +2267,7 @@ class MetadataAnalyzerApp(QMainWindow):
         fs_creation_dt, fs_modification_dt = None, None
         if stats:
             try:
-                fs_modification_dt = datetime.fromtimestamp(stats.st_mtime)
-                ts_cre = stats.st_ctime
-                if hasattr(stats, 'st_birthtime') and stats.st_birthtime:
-                    ts_cre = stats.st_birthtime
-                fs_creation_dt = datetime.fromtimestamp(ts_cre)
+                fs_creation_dt, fs_modification_dt = _fs_times(stats)
             except Exception as fs_e:
                 print(f"Warning: Could not extract filesystem times for comparison in {base_name}: {fs_e}")
 
@@ -1804,118 +2275,114 @@ class MetadataAnalyzerApp(QMainWindow):
             with open(file_path, 'rb') as f:
                 reader = PyPDF2.PdfReader(f, strict=False)
                 meta = reader.metadata
-                if meta:
-                    has_pdf_content = True
-                    fields = {
-                        '/Title': "Title",
-                        '/Author': "Author",
-                        '/Subject': "Subject",
-                        '/Producer': "Producer",
-                        '/Creator': "Creator",
-                        '/CreationDate': "Creation Date",
-                        '/ModDate': "Modification Date",
-                        '/Keywords': "Keywords"
-                    }
-
-                    for field_key, field_name in fields.items():
-                        value = meta.get(field_key)
-                        if value is not None:
-                            value_str = str(value).strip()
-                            pdf_values[field_name] = value
-
-                            if field_key == '/Creator':
-                                creator_item = QTreeWidgetItem(pdf_root, [field_name, value_str])
-                                if "photoshop" in value_str.lower():
-                                    creator_item.setForeground(1, QColor(139, 0, 139))
-                                    self.logical_issues.append(f"File '{base_name}': Created with Photoshop ({value_str})")
-                                elif "acrobat" not in value_str.lower():
-                                    creator_item.setForeground(1, QColor("blue"))
-                            else:
-                                QTreeWidgetItem(pdf_root, [field_name, value_str])
-
-
-                    other_meta = {k: meta[k] for k in meta if k not in fields and meta.get(k) is not None}
-                    if other_meta:
-                        other_root = QTreeWidgetItem(pdf_root, ["Other Metadata"])
-                        for key, value in other_meta.items():
-                            value_str = str(value).strip()
-                            pdf_values[key] = value
-                            QTreeWidgetItem(other_root, [str(key).lstrip('/'), value_str])
-
-
-                    pdf_create_val = pdf_values.get("Creation Date")
-                    pdf_mod_val = pdf_values.get("Modification Date")
-                    pdf_create_dt = parse_pdf_date(pdf_create_val)
-                    pdf_mod_dt = parse_pdf_date(pdf_mod_val)
-
-
-                    fs_mod_naive = fs_modification_dt.replace(tzinfo=None) if fs_modification_dt else None
-                    fs_cre_naive = fs_creation_dt.replace(tzinfo=None) if fs_creation_dt else None
-
-                    if pdf_create_dt or pdf_mod_dt or fs_cre_naive or fs_mod_naive:
-                        issue_prefix = f"File '{base_name}' - PDF Time Issue:"
-                        if pdf_create_dt and pdf_mod_dt and pdf_mod_dt < pdf_create_dt:
-                            time_item = QTreeWidgetItem(pdf_root, ["⚠️ TIME INCONSISTENCY", "ModDate before CreationDate"])
-                            time_item.setForeground(0, QColor("orange"))
-                            self.logical_issues.append(f"{issue_prefix} PDF ModDate ({pdf_mod_dt}) is before PDF CreationDate ({pdf_create_dt})")
-
-                        pdf_create_naive = pdf_create_dt.replace(tzinfo=None) if pdf_create_dt and pdf_create_dt.tzinfo else pdf_create_dt
-                        if pdf_create_naive and fs_mod_naive and pdf_create_naive > fs_mod_naive + timedelta(minutes=1):
-                            time_item = QTreeWidgetItem(pdf_root, ["⚠️ TIME INCONSISTENCY", "PDF created after filesystem modified"])
-                            time_item.setForeground(0, QColor("orange"))
-                            self.logical_issues.append(f"{issue_prefix} PDF CreationDate ({pdf_create_dt}) is significantly after Filesystem Modified ({fs_modification_dt.strftime('%Y-%m-%d %H:%M:%S') if fs_modification_dt else 'N/A'})")
-
-                page_count = len(reader.pages)
-                QTreeWidgetItem(pdf_root, ["Page Count", str(page_count)])
-
-
-                if reader.is_encrypted:
-                    sec_item = QTreeWidgetItem(pdf_root, ["🔒 ENCRYPTION", "Document is encrypted"])
-                    sec_item.setForeground(0, QColor("red"))
-                    self.anomalies.append(f"File '{base_name}': Encrypted PDF document")
-
-                    if reader.metadata is None and page_count > 0:
-                        meta_item = QTreeWidgetItem(pdf_root, ["⚠️ HIDDEN METADATA", "Metadata likely encrypted"])
-                        meta_item.setForeground(0, QColor("orange"))
-                        self.anomalies.append(f"File '{base_name}': PDF metadata likely hidden by encryption")
-
-
-                producer = pdf_values.get("Producer", "").lower()
-                if producer:
-                    suspicious_producers = ["crack", "keygen", "patch", "converter"]
-                    if any(bad in producer for bad in suspicious_producers):
-                        prod_item = QTreeWidgetItem(pdf_root, ["🚨 SUSPICIOUS PRODUCER", pdf_values["Producer"]])
-                        prod_item.setForeground(0, QColor("red"))
-                        self.anomalies.append(f"File '{base_name}': Suspicious PDF producer - {pdf_values['Producer']}")
-
-                if not has_pdf_content and page_count == 0:
-                    QTreeWidgetItem(pdf_root, ["Status", "No metadata found and 0 pages."])
-                    self.logical_issues.append(f"File '{base_name}': PDF has no metadata and 0 pages (potentially empty or corrupt).")
-                elif not has_pdf_content:
-                    QTreeWidgetItem(pdf_root, ["Status", "No standard metadata found."])
+                # Resolve everything the tree needs while the file is open, then drop the
+                # reader: its object cache is cyclic and would otherwise outlive the rows.
+                info = {key: meta[key] for key in meta} if meta is not None else None
+                page_count = _pdf_page_count(reader)
+                is_encrypted = reader.is_encrypted
+                del reader, meta
+
+            if info:
+                has_pdf_content = True
+
+                field_items = []
+                for field_key, field_name in _PDF_INFO_FIELDS.items():
+                    value = info.get(field_key)
+                    if value is not None:
+                        value_str = str(value).strip()
+                        pdf_values[field_name] = value
+
+                        field_item = QTreeWidgetItem([field_name, value_str])
+                        if field_key == '/Creator':
+                            if "photoshop" in value_str.lower():
+                                field_item.setForeground(1, self._C_PURPLE)
+                                logical_issues.append(f"File '{base_name}': Created with Photoshop ({value_str})")
+                            elif "acrobat" not in value_str.lower():
+                                field_item.setForeground(1, self._C_BLUE)
+                        field_items.append(field_item)
+                pdf_root.addChildren(field_items)
+
+
+                other_meta = {k: v for k, v in info.items() if k not in _PDF_INFO_FIELDS and v is not None}
+                if other_meta:
+                    other_root = QTreeWidgetItem(pdf_root, ["Other Metadata"])
+                    other_items = []
+                    for key, value in other_meta.items():
+                        value_str = str(value).strip()
+                        pdf_values[key] = value
+                        other_items.append(QTreeWidgetItem([str(key).lstrip('/'), value_str]))
+                    other_root.addChildren(other_items)
+
+
+                pdf_create_val = pdf_values.get("Creation Date")
+                pdf_mod_val = pdf_values.get("Modification Date")
+                pdf_create_dt = parse_pdf_date(pdf_create_val)
+                pdf_mod_dt = parse_pdf_date(pdf_mod_val)
+
+
+                # _fs_times already yields naive local datetimes.
+                if pdf_create_dt or pdf_mod_dt or fs_creation_dt or fs_modification_dt:
+                    issue_prefix = f"File '{base_name}' - PDF Time Issue:"
+                    if pdf_create_dt and pdf_mod_dt and pdf_mod_dt < pdf_create_dt:
+                        time_item = QTreeWidgetItem(pdf_root, ["⚠️ TIME INCONSISTENCY", "ModDate before CreationDate"])
+                        time_item.setForeground(0, self._C_ORANGE)
+                        logical_issues.append(f"{issue_prefix} PDF ModDate ({pdf_mod_dt}) is before PDF CreationDate ({pdf_create_dt})")
+
+                    pdf_create_naive = pdf_create_dt.replace(tzinfo=None) if pdf_create_dt and pdf_create_dt.tzinfo else pdf_create_dt
+                    if pdf_create_naive and fs_modification_dt and pdf_create_naive > fs_modification_dt + timedelta(minutes=1):
+                        time_item = QTreeWidgetItem(pdf_root, ["⚠️ TIME INCONSISTENCY", "PDF created after filesystem modified"])
+                        time_item.setForeground(0, self._C_ORANGE)
+                        logical_issues.append(f"{issue_prefix} PDF CreationDate ({pdf_create_dt}) is significantly after Filesystem Modified ({fs_modification_dt.strftime('%Y-%m-%d %H:%M:%S') if fs_modification_dt else 'N/A'})")
+
+            QTreeWidgetItem(pdf_root, ["Page Count", str(page_count)])
+
+
+            if is_encrypted:
+                sec_item = QTreeWidgetItem(pdf_root, ["🔒 ENCRYPTION", "Document is encrypted"])
+                sec_item.setForeground(0, self._C_RED)
+                anomalies.append(f"File '{base_name}': Encrypted PDF document")
+
+                if info is None and page_count > 0:
+                    meta_item = QTreeWidgetItem(pdf_root, ["⚠️ HIDDEN METADATA", "Metadata likely encrypted"])
+                    meta_item.setForeground(0, self._C_ORANGE)
+                    anomalies.append(f"File '{base_name}': PDF metadata likely hidden by encryption")
+
+
+            producer = pdf_values.get("Producer", "")
+            if producer:
+                if _SUSPICIOUS_PRODUCER_RE.search(str(producer)):
+                    prod_item = QTreeWidgetItem(pdf_root, ["🚨 SUSPICIOUS PRODUCER", pdf_values["Producer"]])
+                    prod_item.setForeground(0, self._C_RED)
+                    anomalies.append(f"File '{base_name}': Suspicious PDF producer - {pdf_values['Producer']}")
+
+            if not has_pdf_content and page_count == 0:
+                QTreeWidgetItem(pdf_root, ["Status", "No metadata found and 0 pages."])
+                logical_issues.append(f"File '{base_name}': PDF has no metadata and 0 pages (potentially empty or corrupt).")
+            elif not has_pdf_content:
+                QTreeWidgetItem(pdf_root, ["Status", "No standard metadata found."])
 
         except FileNotFoundError:
-            self.anomalies.append(f"{base_name}: File not found during PDF processing.")
-            QTreeWidgetItem(pdf_root, ["Error", "File not found."]).setForeground(1, QColor("red"))
+            anomalies.append(f"{base_name}: File not found during PDF processing.")
+            QTreeWidgetItem(pdf_root, ["Error", "File not found."]).setForeground(1, self._C_RED)
         except PyPDF2.errors.PdfReadError as pdf_err:
-            self.anomalies.append(f"{base_name}: Error reading PDF (likely corrupt or password protected) - {pdf_err}")
-            QTreeWidgetItem(pdf_root, ["Error", f"Failed to read PDF: {pdf_err}"]).setForeground(1, QColor("red"))
+            anomalies.append(f"{base_name}: Error reading PDF (likely corrupt or password protected) - {pdf_err}")
+            QTreeWidgetItem(pdf_root, ["Error", f"Failed to read PDF: {pdf_err}"]).setForeground(1, self._C_RED)
         except Exception as e:
             err_type = type(e).__name__
-            self.anomalies.append(f"{base_name}: Error processing PDF ({err_type}) - {e}")
-            QTreeWidgetItem(pdf_root, ["Error", f"PDF processing failed: {e}"]).setForeground(1, QColor("red"))
+            anomalies.append(f"{base_name}: Error processing PDF ({err_type}) - {e}")
+            QTreeWidgetItem(pdf_root, ["Error", f"PDF processing failed: {e}"]).setForeground(1, self._C_RED)
 
-    def process_docx(self, file_path, parent_item, stats):
-        base_name = os.path.basename(file_path)
-        if not Document:
-            QTreeWidgetItem(parent_item, ["DOCX Status", "python-docx library missing."]).setForeground(1, QColor("orange"))
+    def process_docx(self, file_path, parent_item, stats, base_name, ext, anomalies, logical_issues):
+        docx = _optional_import("docx")
+        if not docx:
+            QTreeWidgetItem(parent_item, ["DOCX Status", "python-docx library missing."]).setForeground(1, self._C_ORANGE)
             return
 
         docx_root = QTreeWidgetItem(parent_item, ["DOCX Metadata"])
         has_docx_content = False
 
         try:
-            doc = Document(file_path)
+            doc = docx.Document(file_path)
             core_properties = doc.core_properties
 
 
@@ -1954,11 +2421,11 @@ class MetadataAnalyzerApp(QMainWindow):
                         modifier_item = QTreeWidgetItem(docx_root, [prop_name, value_str])
                         last_mod = value_str.lower()
                         if "admin" in last_mod:
-                            modifier_item.setForeground(1, QColor("orange"))
-                            self.anomalies.append(f"File '{base_name}': Modified by admin account - {value_str}")
+                            modifier_item.setForeground(1, self._C_ORANGE)
+                            anomalies.append(f"File '{base_name}': Modified by admin account - {value_str}")
                         elif "temp" in last_mod or "user" in last_mod:
-                            modifier_item.setForeground(1, QColor("blue"))
-                            self.logical_issues.append(f"File '{base_name}': Modified by generic account - {value_str}")
+                            modifier_item.setForeground(1, self._C_BLUE)
+                            logical_issues.append(f"File '{base_name}': Modified by generic account - {value_str}")
                     else:
                         QTreeWidgetItem(docx_root, [prop_name, value_str])
 
@@ -1966,163 +2433,181 @@ class MetadataAnalyzerApp(QMainWindow):
             fs_creation_dt, fs_modification_dt = None, None
             if stats:
                 try:
-                    fs_modification_dt = datetime.fromtimestamp(stats.st_mtime)
-                    ts_cre = stats.st_ctime
-                    if hasattr(stats, 'st_birthtime') and stats.st_birthtime:
-                        ts_cre = stats.st_birthtime
-                    fs_creation_dt = datetime.fromtimestamp(ts_cre)
+                    fs_creation_dt, fs_modification_dt = _fs_times(stats)
                 except Exception as fs_e:
                     print(f"Warning: Could not extract filesystem times for comparison in {base_name}: {fs_e}")
 
 
-            fs_mod_naive = fs_modification_dt.replace(tzinfo=None) if fs_modification_dt else None
-            fs_cre_naive = fs_creation_dt.replace(tzinfo=None) if fs_creation_dt else None
+            # _fs_times already yields naive local datetimes; only the DOCX ones need stripping.
             docx_cre_naive = docx_create_dt.replace(tzinfo=None) if docx_create_dt and docx_create_dt.tzinfo else docx_create_dt
             docx_mod_naive = docx_mod_dt.replace(tzinfo=None) if docx_mod_dt and docx_mod_dt.tzinfo else docx_mod_dt
 
-            if docx_cre_naive or docx_mod_naive or fs_cre_naive or fs_mod_naive:
+            if docx_cre_naive or docx_mod_naive or fs_creation_dt or fs_modification_dt:
                 issue_prefix = f"File '{base_name}' - DOCX Time Issue:"
                 if docx_cre_naive and docx_mod_naive and docx_mod_naive < docx_cre_naive:
                     time_item = QTreeWidgetItem(docx_root, ["⚠️ TIME INCONSISTENCY", "Modified before Created"])
-                    time_item.setForeground(0, QColor("orange"))
-                    self.logical_issues.append(f"{issue_prefix} DOCX Modified ({docx_mod_dt}) is before DOCX Created ({docx_create_dt})")
-                if docx_cre_naive and fs_mod_naive and docx_cre_naive > fs_mod_naive + timedelta(minutes=1):
+                    time_item.setForeground(0, self._C_ORANGE)
+                    logical_issues.append(f"{issue_prefix} DOCX Modified ({docx_mod_dt}) is before DOCX Created ({docx_create_dt})")
+                if docx_cre_naive and fs_modification_dt and docx_cre_naive > fs_modification_dt + timedelta(minutes=1):
                     time_item = QTreeWidgetItem(docx_root, ["⚠️ TIME INCONSISTENCY", "Created after filesystem modified"])
-                    time_item.setForeground(0, QColor("orange"))
-                    self.logical_issues.append(f"{issue_prefix} DOCX Created ({docx_create_dt}) is significantly after Filesystem Modified ({fs_modification_dt.strftime('%Y-%m-%d %H:%M:%S') if fs_modification_dt else 'N/A'})")
+                    time_item.setForeground(0, self._C_ORANGE)
+                    logical_issues.append(f"{issue_prefix} DOCX Created ({docx_create_dt}) is significantly after Filesystem Modified ({fs_modification_dt.strftime('%Y-%m-%d %H:%M:%S') if fs_modification_dt else 'N/A'})")
 
 
+            # Count in XPath rather than len(doc.paragraphs) etc., which wrap every element
+            # in a python-docx proxy only to discard it. The expressions match python-docx's:
+            # direct body children for paragraphs/tables, document-wide inline drawings.
+            body = doc.element.body
             stats_root = QTreeWidgetItem(docx_root, ["Document Statistics"])
-            QTreeWidgetItem(stats_root, ["Paragraphs", str(len(doc.paragraphs))])
-            QTreeWidgetItem(stats_root, ["Tables", str(len(doc.tables))])
+            QTreeWidgetItem(stats_root, ["Paragraphs", str(int(body.xpath('count(w:p)')))])
+            QTreeWidgetItem(stats_root, ["Tables", str(int(body.xpath('count(w:tbl)')))])
 
 
-            inline_shape_count = len(doc.inline_shapes)
+            inline_shape_count = int(body.xpath('count(//w:p/w:r/w:drawing/wp:inline)'))
             QTreeWidgetItem(stats_root, ["Inline Shapes (Images, etc.)", str(inline_shape_count)])
             if inline_shape_count > 20:
                 shape_item = QTreeWidgetItem(stats_root, ["⚠️ MANY EMBEDDED OBJECTS", str(inline_shape_count)])
-                shape_item.setForeground(0, QColor("orange"))
-                self.logical_issues.append(f"File '{base_name}': Contains many embedded objects ({inline_shape_count})")
+                shape_item.setForeground(0, self._C_ORANGE)
+                logical_issues.append(f"File '{base_name}': Contains many embedded objects ({inline_shape_count})")
 
 
             if hasattr(doc, 'part') and hasattr(doc.part, 'rels'):
-                for rel in doc.part.rels.values():
-                    if 'vbaProject' in str(rel.target_ref):
-                        macro_item = QTreeWidgetItem(docx_root, ["🚨 MACRO DETECTED", "Document contains VBA macros"])
-                        macro_item.setForeground(0, QColor("red"))
-                        self.anomalies.append(f"File '{base_name}': Contains VBA macros (potential security risk)")
-                        break
+                rels = doc.part.rels.values()
+                # target_ref is already a str for python-docx; only convert anything else.
+                if any('vbaProject' in (ref if isinstance(ref, str) else str(ref))
+                       for ref in (rel.target_ref for rel in rels)):
+                    macro_item = QTreeWidgetItem(docx_root, ["🚨 MACRO DETECTED", "Document contains VBA macros"])
+                    macro_item.setForeground(0, self._C_RED)
+                    anomalies.append(f"File '{base_name}': Contains VBA macros (potential security risk)")
 
             if not has_docx_content:
                 QTreeWidgetItem(docx_root, ["Status", "No standard metadata found."])
 
         except FileNotFoundError:
-            self.anomalies.append(f"{base_name}: File not found during DOCX processing.")
-            QTreeWidgetItem(docx_root, ["Error", "File not found."]).setForeground(1, QColor("red"))
+            anomalies.append(f"{base_name}: File not found during DOCX processing.")
+            QTreeWidgetItem(docx_root, ["Error", "File not found."]).setForeground(1, self._C_RED)
         except Exception as e:
             err_type = type(e).__name__
             if "zipfile.BadZipFile" in str(type(e)):
-                self.anomalies.append(f"{base_name}: Error processing DOCX - File may be corrupt or not a valid DOCX (BadZipFile).")
-                QTreeWidgetItem(docx_root, ["Error", "DOCX processing failed: BadZipFile (corrupt?)"]).setForeground(1, QColor("red"))
+                anomalies.append(f"{base_name}: Error processing DOCX - File may be corrupt or not a valid DOCX (BadZipFile).")
+                QTreeWidgetItem(docx_root, ["Error", "DOCX processing failed: BadZipFile (corrupt?)"]).setForeground(1, self._C_RED)
             else:
-                self.anomalies.append(f"{base_name}: Error processing DOCX ({err_type}) - {e}")
-                QTreeWidgetItem(docx_root, ["Error", f"DOCX processing failed: {e}"]).setForeground(1, QColor("red"))
-
-    def process_media(self, file_path, parent_item, stats):
-        base_name = os.path.basename(file_path)
+                anomalies.append(f"{base_name}: Error processing DOCX ({err_type}) - {e}")
+                QTreeWidgetItem(docx_root, ["Error", f"DOCX processing failed: {e}"]).setForeground(1, self._C_RED)
+
+    def _read_media_metadata(self, mutagen, file_path):
+        """Parses a media file into plain (status, tag rows, technical rows) for process_media."""
+        audio = mutagen.File(file_path, easy=True)
+        if audio is None:
+            if mutagen.File(file_path) is None:
+                return "File is not a supported media format or is corrupt.", (), None
+            return "Standard tags not found, complex tags may exist.", (), None
+
+        tag_rows = []
+        for tag_key, display_name in _COMMON_MEDIA_TAGS:
+            # One lookup instead of an `in` test followed by [].
+            value = audio.get(tag_key)
+            if value is None:
+                continue
+
+            if isinstance(value, list):
+                # Most frames hold a single value; a sized list lets join size its buffer up front.
+                value_str = str(value[0]) if len(value) == 1 else ", ".join([str(v) for v in value])
+            else:
+                 value_str = str(value)
+            tag_rows.append((display_name, value_str.strip()))
+
+
+        tech_rows = None
+        # getattr with a sentinel probes each attribute once, where hasattr + getattr took two.
+        info = getattr(audio, 'info', _MISSING)
+        if info is not _MISSING:
+            tech_rows = []
+            for attr, display_name in _MEDIA_TECH_ATTRS:
+                value = getattr(info, attr, _MISSING)
+                if value is _MISSING:
+                    continue
+                tech_rows.append((display_name, f"{value:.2f}" if attr == 'length' else str(value)))
+
+
+            # mutagen derives .mime from the file type's class hierarchy, so join it once per class.
+            audio_cls = type(audio)
+            mime = _MIME_CACHE.get(audio_cls)
+            if mime is None:
+                mime = _MIME_CACHE[audio_cls] = ", ".join(getattr(audio, 'mime', None) or ())
+            if mime:
+                tech_rows.append(("MIME Type", mime))
+
+            codec = getattr(info, 'codec', _MISSING)
+            if codec is not _MISSING:
+                tech_rows.append(("Codec", str(codec)))
+            tech_rows = tuple(tech_rows)
+
+        return None, tuple(tag_rows), tech_rows
+
+    def process_media(self, file_path, parent_item, stats, base_name, ext, anomalies, logical_issues):
+        mutagen = _optional_import("mutagen")
         if not mutagen:
-            QTreeWidgetItem(parent_item, ["Media Status", "mutagen library missing."]).setForeground(1, QColor("orange"))
+            QTreeWidgetItem(parent_item, ["Media Status", "mutagen library missing."]).setForeground(1, self._C_ORANGE)
             return
 
         media_root = QTreeWidgetItem(parent_item, ["Media Metadata"])
-        has_media_content = False
 
         try:
+            cache_key = (stats.st_dev, stats.st_ino, stats.st_size, stats.st_mtime_ns) if stats else None
+            parsed = None
+            if cache_key is not None:
+                with self._media_cache_lock:
+                    parsed = self._media_cache.get(cache_key)
+                    if parsed is not None:
+                        self._media_cache.move_to_end(cache_key)
+
+            if parsed is None:
+                parsed = self._read_media_metadata(mutagen, file_path)
+                if cache_key is not None:
+                    with self._media_cache_lock:
+                        self._media_cache[cache_key] = parsed
+                        if len(self._media_cache) > _MEDIA_CACHE_SIZE:
+                            self._media_cache.popitem(last=False)
+
+            status, tag_rows, tech_rows = parsed
+            if status:
+                QTreeWidgetItem(media_root, ["Status", status])
+                return
 
-            audio = mutagen.File(file_path, easy=True)
-            if audio is None:
-
-                 audio_complex = mutagen.File(file_path)
-                 if audio_complex is None:
-                     QTreeWidgetItem(media_root, ["Status", "File is not a supported media format or is corrupt."])
-                     return
-                 else:
-
-
-                      QTreeWidgetItem(media_root, ["Status", "Standard tags not found, complex tags may exist."])
-
-                      return
-
-
-            common_tags = {
-                'title': 'Title',
-                'artist': 'Artist',
-                'album': 'Album',
-                'date': 'Date',
-                'genre': 'Genre',
-                'tracknumber': 'Track Number',
-                'comment': 'Comment',
-                'albumartist': 'Album Artist',
-                'composer': 'Composer',
-                'discnumber': 'Disc Number',
-                'organization': 'Organization',
-                'encodedby': 'Encoded By',
-                'copyright': 'Copyright',
-            }
-
-            for tag_key, display_name in common_tags.items():
-                if tag_key in audio:
-                    has_media_content = True
-                    value = audio[tag_key]
+            # Rows are built unparented and attached with one addChildren() per group.
+            if tag_rows:
+                media_root.addChildren([QTreeWidgetItem([display_name, value_str]) for display_name, value_str in tag_rows])
 
-                    if isinstance(value, list):
-                        value_str = ", ".join(str(v) for v in value)
-                    else:
-                         value_str = str(value)
-                    QTreeWidgetItem(media_root, [display_name, value_str.strip()])
 
-
-            if hasattr(audio, 'info'):
+            if tech_rows is not None:
                 tech_info_root = QTreeWidgetItem(media_root, ["Technical Info"])
-                has_media_content = True
-                info = audio.info
-                tech_attrs = {
-                    'length': 'Duration (s)',
-                    'bitrate': 'Bitrate (bps)',
-                    'sample_rate': 'Sample Rate (Hz)',
-                    'channels': 'Channels',
-
-                }
-                for attr, display_name in tech_attrs.items():
-                    if hasattr(info, attr):
-                         value = getattr(info, attr)
-                         if attr == 'length':
-                             value = f"{value:.2f}"
-                         elif attr == 'bitrate':
-                              value = f"{value}"
-                         QTreeWidgetItem(tech_info_root, [display_name, str(value)])
-
-
-                if hasattr(audio, 'mime') and audio.mime:
-                    QTreeWidgetItem(tech_info_root, ["MIME Type", ", ".join(audio.mime)])
-
-                if hasattr(info, 'codec'):
-                    QTreeWidgetItem(tech_info_root, ["Codec", str(info.codec)])
+                tech_info_root.addChildren([QTreeWidgetItem([display_name, value_str]) for display_name, value_str in tech_rows])
 
 
-            if not has_media_content:
+            if not tag_rows and tech_rows is None:
                 QTreeWidgetItem(media_root, ["Status", "No standard metadata tags found."])
 
         except FileNotFoundError:
-            self.anomalies.append(f"{base_name}: File not found during Media processing.")
-            QTreeWidgetItem(media_root, ["Error", "File not found."]).setForeground(1, QColor("red"))
+            self._media_error(media_root, anomalies, f"{base_name}: File not found during Media processing.", "File not found.")
         except mutagen.MutagenError as e:
-             self.anomalies.append(f"{base_name}: Error processing Media file (mutagen error) - {e}")
-             QTreeWidgetItem(media_root, ["Error", f"Mutagen processing failed: {e}"]).setForeground(1, QColor("red"))
-        except Exception as e:
+            self._media_error(media_root, anomalies, f"{base_name}: Error processing Media file (mutagen error) - {e}", f"Mutagen processing failed: {e}")
+        except _MEDIA_EXC as e:
             err_type = type(e).__name__
-            self.anomalies.append(f"{base_name}: Error processing Media file ({err_type}) - {e}")
-            QTreeWidgetItem(media_root, ["Error", f"Media processing failed: {e}"]).setForeground(1, QColor("red"))
+            self._media_error(media_root, anomalies, f"{base_name}: Error processing Media file ({err_type}) - {e}", f"Media processing failed: {e}")
+
+    def _media_error(self, media_root, anomalies, anomaly, message):
+        """Records a media anomaly and adds the matching red Error row."""
+        anomalies.append(anomaly)
+        QTreeWidgetItem(media_root, ["Error", message]).setForeground(1, self._C_RED)
+
+    def closeEvent(self, event):
+        """Drops queued analysis and waits for running workers so none outlives the window."""
+        self._analysis_cancelled.set()
+        self._flush_timer.stop()
+        self._analysis_pool.clear()
+        self._analysis_pool.waitForDone()
+        super().closeEvent(event)
 
     def show_anomalies(self):
         if self.anomalies:
@@ -2140,7 +2625,9 @@ class MetadataAnalyzerApp(QMainWindow):
 
     def clear_results_ui_only(self):
         self.tree.clear()
+        self._search_index = []
         self.preview_widget.clear_preview()
+        self.current_file_path = None
         self.anomalies = []
         self.logical_issues = []
         self.anomalies_btn.setEnabled(False)
@@ -2161,14 +2648,12 @@ if __name__ == '__main__':
     app = QApplication(sys.argv)
 
 
-    styles = QStyleFactory.keys()
-    if 'Fusion' in styles:
-        app.setStyle('Fusion')
-    elif 'WindowsVista' in styles:
-        app.setStyle('WindowsVista')
+    style = QStyleFactory.create('Fusion') or QStyleFactory.create('WindowsVista')
+    if style is not None:
+        app.setStyle(style)
 
 
-    if platform.system() == 'Windows':
+    if sys.platform == 'win32':
 
         try:
             import ctypes